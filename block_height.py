@@ -6,13 +6,19 @@ This ensures all volume and liquidity calculations use the same blockchain state
 """
 
 import json
+import threading
 import time
+from contextlib import contextmanager
 from verus_rpc import make_verus_rpc
 
 # Global cache for session-based block height
 _session_block_height = None
 _session_id = None
 
+# Guards session start/clear; session_scope holds it for a whole unit of work so work
+# running in other threads cannot replace or clear the session underneath it
+_session_lock = threading.RLock()
+
 def start_new_session():
     """
     Start a new API session, clearing any cached block height
@@ -23,11 +29,12 @@ def start_new_session():
     """
     global _session_block_height, _session_id
     
-    _session_block_height = None
-    _session_id = f"session_{int(time.time() * 1000)}"
-    
-    print(f"🆕 Started new API session: {_session_id}")
-    return _session_id
+    with _session_lock:
+        _session_block_height = None
+        _session_id = f"session_{int(time.time() * 1000)}"
+        
+        print(f"🆕 Started new API session: {_session_id}")
+        return _session_id
 
 def get_session_block_height(session_id=None):
     """
@@ -85,12 +92,30 @@ def clear_session():
     """
     global _session_block_height, _session_id
     
-    old_session = _session_id
-    _session_block_height = None
-    _session_id = None
+    with _session_lock:
+        old_session = _session_id
+        _session_block_height = None
+        _session_id = None
     
     print(f"🧹 Cleared session: {old_session}")
 
+@contextmanager
+def session_scope():
+    """
+    Run a unit of work in its own session, started on entry and cleared on exit
+    Other threads block in start_new_session/clear_session until the scope ends,
+    so overlapping requests cannot replace or clear each other's session
+    
+    Yields:
+        str: Session ID
+    """
+    with _session_lock:
+        session_id = start_new_session()
+        try:
+            yield session_id
+        finally:
+            clear_session()
+
 def estimate_vrsc_to_dai():
     """
     Estimate VRSC to DAI conversion rate using estimateconversion
@@ -4,13 +4,54 @@ Converter Discovery Module
 Discovers all active converters while respecting exclusion rules
 """
 
-import json
+import os
+import logging
+import tempfile
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from verus_rpc import make_rpc_call
 from dict import get_ticker_by_id, get_min_native_tokens
 from block_height import get_session_block_height, get_current_session_id
 
-# Define excluded converters that should be filtered out
-excluded_chains = ["Bridge.CHIPS", "Bridge.vDEX", "Bridge.vARRR", "whales"]
+logger = logging.getLogger(__name__)
+
+# Native currency IDs for each supported chain
+CHAIN_CURRENCY_IDS = {
+    'VRSC': 'i5w5MuNik5NtLcYmNzcvaoixooEebB6MGV',
+    'CHIPS': 'iJ3WZocnjG9ufv7GKUA4LijQno5gTMb7tP',  # CHIPS currency ID
+    'VARRR': 'iExBJfZYK7KREDpuhj6PzZBzqMAKaFg7d2',  # VARRR currency ID
+    'VDEX': 'iHog9UCTrn95qpUBFCZ7kKz7qWdMA8MQ6N'   # VDEX currency ID
+}
+
+# Define which bridge converters belong to which chains
+BRIDGE_CONVERTER_CHAINS = {
+    'Bridge.CHIPS': 'CHIPS',
+    'Bridge.vARRR': 'VARRR',
+    'Bridge.vDEX': 'VDEX',
+    'Bridge.vETH': 'VRSC'  # vETH bridge is hosted on VRSC
+}
+
+# Converter keys that hold metadata rather than the converter's currency ID
+CONVERTER_META_KEYS = frozenset({'fullyqualifiedname', 'height', 'output', 'lastnotarization'})
+
+# Discovery output file - CONVERTER_DISCOVERY_PATH overrides the default next to this module
+CONVERTER_DISCOVERY_FILE = os.getenv(
+    'CONVERTER_DISCOVERY_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'converter_discovery.json')
+)
+
+# Cache of getcurrencyconverters results keyed by (chain, system_id, session_id)
+# The session block height is VRSC's, so it cannot tell when another chain advances;
+# results are reused only within one session and dropped when a new session starts
+_converters_cache = {}
+_converters_cache_lock = threading.Lock()
+
+# Serializes background writes of the discovery file
+_save_lock = threading.Lock()
+
+# Most recently started background save, so a CLI run can wait for it
+_save_thread = None
 
 def get_all_converters(system_id=None, chain="VRSC"):
     """
@@ -28,158 +69,48 @@ def get_all_converters(system_id=None, chain="VRSC"):
         if system_id is None:
             system_id = chain
         
-        print(f"🔄 Fetching all converters for system: {system_id} on chain: {chain}")
+        logger.info("🔄 Fetching all converters for system: %s on chain: %s", system_id, chain)
         
         # Get session block height for consistency
         block_height = get_session_block_height()
-        print(f"🔄 Using cached session block height: {block_height} (session: {get_current_session_id()})")
+        logger.info("🔄 Using cached session block height: %s (session: %s)", block_height, get_current_session_id())
+        
+        # Serve repeat discoveries within the same session from memory
+        session_id = get_current_session_id()
+        cache_key = (chain, system_id, session_id)
+        with _converters_cache_lock:
+            cached_result = _converters_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info("✅ Using cached converters for %s on %s in session %s (%d converters)", system_id, chain, session_id, len(cached_result))
+            return cached_result
         
         # Make RPC call to get currency converters using the chain's native currency
         result = make_rpc_call(chain, "getcurrencyconverters", [system_id])
         
         if result is None:
-            print(f"❌ Failed to get converters for {system_id} on {chain}")
+            logger.error("❌ Failed to get converters for %s on %s", system_id, chain)
             return None
         
         if isinstance(result, list) and len(result) > 0:
-            print(f"✅ Successfully fetched {len(result)} converters for {system_id} on {chain} at block {block_height}")
+            logger.info("✅ Successfully fetched %d converters for %s on %s at block %s", len(result), system_id, chain, block_height)
+            if session_id is not None:
+                with _converters_cache_lock:
+                    # Drop entries from older sessions so the cache only holds the current one
+                    for key in [k for k in _converters_cache if k[2] != session_id]:
+                        del _converters_cache[key]
+                    _converters_cache[cache_key] = result
             return result
         else:
-            print(f"⚠️ No converters found for {system_id} on {chain}")
+            logger.warning("⚠️ No converters found for %s on %s", system_id, chain)
             return []
             
     except Exception as e:
-        print(f"❌ Error fetching converters for {system_id} on {chain}: {e}")
+        logger.error("❌ Error fetching converters for %s on %s: %s", system_id, chain, e)
         return None
 
-def filter_converters(converters_data):
-    """
-    Filter converters to exclude problematic ones based on exclusion rules
-    
-    Args:
-        converters_data (list): Raw converter data from RPC call
-        
-    Returns:
-        tuple: (filtered_converters, excluded_converters)
-    """
-    if not converters_data:
-        return [], []
-    
-    filtered_converters = []
-    excluded_converters = []
-    
-    print(f"🔄 Filtering converters (excluding: {excluded_chains})")
-    
-    for converter in converters_data:
-        if 'fullyqualifiedname' in converter:
-            converter_name = converter['fullyqualifiedname']
-            
-            # Check if this converter should be excluded
-            if converter_name in excluded_chains:
-                excluded_converters.append(converter)
-                print(f"❌ Excluded converter: {converter_name}")
-            else:
-                filtered_converters.append(converter)
-                print(f"✅ Included converter: {converter_name}")
-        else:
-            print(f"⚠️  Converter missing fullyqualifiedname: {converter}")
-    
-    print(f"🎯 Filter results: {len(filtered_converters)} included, {len(excluded_converters)} excluded")
-    return filtered_converters, excluded_converters
-
-def filter_bridge_converters_by_chain(converters_data, chain):
-    """
-    Filter out bridge converters that should be sourced from other chains to avoid double-counting
-    
-    Args:
-        converters_data (list): List of raw converter data
-        chain (str): Current chain being processed
-        
-    Returns:
-        list: Filtered converters (excludes bridge converters from wrong chains)
-    """
-    try:
-        print(f"🔄 Filtering bridge converters for {chain} chain")
-        
-        filtered_converters = []
-        excluded_count = 0
-        
-        # Define which bridge converters belong to which chains
-        bridge_converter_chains = {
-            'Bridge.CHIPS': 'CHIPS',
-            'Bridge.vARRR': 'VARRR', 
-            'Bridge.vDEX': 'VDEX',
-            'Bridge.vETH': 'VRSC'  # vETH bridge is hosted on VRSC
-        }
-        
-        for converter in converters_data:
-            converter_name = converter.get('fullyqualifiedname', '')
-            
-            # Check if this is a bridge converter
-            if converter_name.startswith('Bridge.'):
-                # Get the chain this bridge converter should be sourced from
-                expected_chain = bridge_converter_chains.get(converter_name)
-                
-                if expected_chain == chain:
-                    # This bridge converter belongs to this chain - include it
-                    filtered_converters.append(converter)
-                    print(f"✅ Included bridge converter: {converter_name} (belongs to {chain})")
-                else:
-                    # This bridge converter should be sourced from another chain - exclude it
-                    excluded_count += 1
-                    print(f"❌ Excluded bridge converter: {converter_name} (belongs to {expected_chain}, not {chain})")
-            else:
-                # Not a bridge converter - include all native converters
-                filtered_converters.append(converter)
-                print(f"✅ Included native converter: {converter_name}")
-        
-        print(f"🎯 Bridge filter results for {chain}: {len(filtered_converters)} included, {excluded_count} excluded")
-        return filtered_converters
-        
-    except Exception as e:
-        print(f"❌ Error filtering bridge converters for {chain}: {e}")
-        return converters_data
-
-def filter_converters_by_native_holdings(converters_data):
-    """
-    Filter converters based on minimum native token holdings per chain
-    
-    Args:
-        converters_data (list): List of raw converter data with source_chain info
-        
-    Returns:
-        tuple: (included_converters, excluded_converters)
-    """
-    try:
-        print(f"🔄 Filtering converters by native token holdings")
-        
-        included_converters = []
-        excluded_converters = []
-        
-        for converter in converters_data:
-            converter_name = converter.get('currencyname', 'Unknown')
-            source_chain = converter.get('source_chain', 'VRSC')
-            
-            # Get minimum native token threshold for this chain
-            min_threshold = get_min_native_tokens(source_chain)
-            
-            # Get native token holdings from reserve currencies
-            native_holdings = get_native_token_holdings(converter, source_chain)
-            
-            if native_holdings >= min_threshold:
-                print(f"✅ Included converter: {converter_name} ({native_holdings:.0f} {source_chain} >= {min_threshold})")
-                included_converters.append(converter)
-            else:
-                print(f"❌ Excluded converter: {converter_name} ({native_holdings:.0f} {source_chain} < {min_threshold})")
-                excluded_converters.append(converter)
-        
-        print(f"🎯 Filter results: {len(included_converters)} included, {len(excluded_converters)} excluded")
-        
-        return included_converters, excluded_converters
-        
-    except Exception as e:
-        print(f"❌ Error filtering converters: {e}")
-        return converters_data, []
+def _as_float(value):
+    """Convert an RPC number to float, skipping the call when it already is one"""
+    return value if type(value) is float else float(value)
 
 def get_native_token_holdings(converter, chain):
     """
@@ -193,59 +124,37 @@ def get_native_token_holdings(converter, chain):
         float: Amount of native tokens held
     """
     try:
-        # Check if this is processed converter data with reserve_currencies
-        if 'reserve_currencies' in converter:
-            reserve_currencies = converter['reserve_currencies']
-            for reserve in reserve_currencies:
-                ticker = reserve.get('ticker', '')
-                if ticker == chain:  # VRSC, CHIPS, VARRR, VDEX
-                    return float(reserve.get('reserves', 0))
-        
-        # Check if this is raw RPC data - look in lastnotarization.currencystate.reservecurrencies
-        elif 'lastnotarization' in converter:
-            currency_state = converter.get('lastnotarization', {}).get('currencystate', {})
-            reserve_currencies = currency_state.get('reservecurrencies', [])
-            
-            # Map chain names to their currency IDs
-            chain_currency_ids = {
-                'VRSC': 'i5w5MuNik5NtLcYmNzcvaoixooEebB6MGV',
-                'CHIPS': 'iJ3WZocnjG9ufv7GKUA4LijQno5gTMb7tP',  # CHIPS currency ID
-                'VARRR': 'iExBJfZYK7KREDpuhj6PzZBzqMAKaFg7d2',  # VARRR currency ID  
-                'VDEX': 'iHog9UCTrn95qpUBFCZ7kKz7qWdMA8MQ6N'   # VDEX currency ID
-            }
-            
-            target_currency_id = chain_currency_ids.get(chain)
-            if target_currency_id:
-                for reserve in reserve_currencies:
-                    if reserve.get('currencyid') == target_currency_id:
-                        return float(reserve.get('reserves', 0))
+        # Raw RPC data is by far the most common shape here (discovery pass) -
+        # look in lastnotarization.currencystate.reservecurrencies first
+        if 'lastnotarization' in converter:
+            currency_state = converter['lastnotarization'].get('currencystate') or {}
             
-            # Fallback: also check by chain name directly
-            for reserve in reserve_currencies:
-                currency_id = reserve.get('currencyid', '')
-                if currency_id == chain:
-                    return float(reserve.get('reserves', 0))
+            # Match the chain's native currency ID, falling back to the chain name itself;
+            # unknown chains can only match by name
+            target_currency_id = CHAIN_CURRENCY_IDS.get(chain, chain)
+            for reserve in currency_state.get('reservecurrencies') or ():
+                currency_id = reserve.get('currencyid')
+                if currency_id == target_currency_id or currency_id == chain:
+                    return _as_float(reserve.get('reserves', 0))
+        
+        # Check if this is processed converter data with reserve_currencies
+        elif 'reserve_currencies' in converter:
+            for reserve in converter['reserve_currencies']:
+                if reserve.get('ticker') == chain:  # VRSC, CHIPS, VARRR, VDEX
+                    return _as_float(reserve.get('reserves', 0))
         
         # Check if this is raw RPC data with reserves field (older format)
         elif 'reserves' in converter:
-            reserves = converter.get('reserves', {})
-            
-            # Look for the native currency in reserves
-            native_currency = chain  # VRSC, CHIPS, VARRR, VDEX
-            
-            if native_currency in reserves:
-                return float(reserves[native_currency])
-            
-            # Also check for the chain name in different formats
-            for currency_id, amount in reserves.items():
-                if currency_id == native_currency:
-                    return float(amount)
+            # Look for the native currency (VRSC, CHIPS, VARRR, VDEX) in reserves
+            reserves = converter['reserves']
+            if chain in reserves:
+                return _as_float(reserves[chain])
         
         # If no native currency found, return 0
         return 0.0
         
     except Exception as e:
-        print(f"❌ Error getting native token holdings for {converter.get('currencyname', converter.get('name', converter.get('fullyqualifiedname', 'Unknown')))}: {e}")
+        logger.error("❌ Error getting native token holdings for %s: %s", converter.get('currencyname', converter.get('name', converter.get('fullyqualifiedname', 'Unknown'))), e)
         return 0.0
 
 def extract_converter_info(converter):
@@ -258,13 +167,14 @@ def extract_converter_info(converter):
     Returns:
         dict: Extracted converter information
     """
+    source_chain = converter.get('source_chain', 'VRSC')
     info = {
         'name': None,
         'currency_id': None,
         'supply': None,
         'reserve_currencies': [],
-        'source_chain': converter.get('source_chain', 'VRSC'),
-        'chain': converter.get('source_chain', 'VRSC'),  # Add chain field for API compatibility
+        'source_chain': source_chain,
+        'chain': source_chain,  # Add chain field for API compatibility
         'currencies': [],  # Add currencies field for API compatibility
         'total_liquidity_usd': 0.0,  # Add liquidity field for API compatibility
         'raw_data': converter
@@ -275,11 +185,8 @@ def extract_converter_info(converter):
         if 'fullyqualifiedname' in converter:
             info['name'] = converter['fullyqualifiedname']
         
-        # Extract currency ID from the converter keys
-        for key in converter.keys():
-            if key not in ['fullyqualifiedname', 'height', 'output', 'lastnotarization']:
-                info['currency_id'] = key
-                break
+        # Extract currency ID from the converter keys (first key that is not metadata)
+        info['currency_id'] = next((key for key in converter if key not in CONVERTER_META_KEYS), None)
         
         # Extract detailed info from lastnotarization
         if 'lastnotarization' in converter and 'currencystate' in converter['lastnotarization']:
@@ -287,30 +194,69 @@ def extract_converter_info(converter):
             
             # Get supply
             if 'supply' in currency_state:
-                info['supply'] = float(currency_state['supply'])
+                info['supply'] = _as_float(currency_state['supply'])
             
             # Get reserve currencies
             if 'reservecurrencies' in currency_state:
+                reserve_currencies = info['reserve_currencies']
+                currencies = info['currencies']
                 for rc in currency_state['reservecurrencies']:
-                    ticker = get_ticker_by_id(rc.get('currencyid', ''))
-                    reserve_info = {
-                        'currency_id': rc.get('currencyid', ''),
+                    currency_id = rc.get('currencyid', '')
+                    ticker = get_ticker_by_id(currency_id)
+                    reserve_currencies.append({
+                        'currency_id': currency_id,
                         'ticker': ticker,
-                        'weight': float(rc.get('weight', 0)),
-                        'reserves': float(rc.get('reserves', 0)),
-                        'price_in_reserve': float(rc.get('priceinreserve', 0))
-                    }
-                    info['reserve_currencies'].append(reserve_info)
+                        'weight': _as_float(rc.get('weight', 0)),
+                        'reserves': _as_float(rc.get('reserves', 0)),
+                        'price_in_reserve': _as_float(rc.get('priceinreserve', 0))
+                    })
                     
                     # Add to currencies list for API compatibility
                     if ticker:
-                        info['currencies'].append(ticker)
+                        currencies.append(ticker)
         
     except Exception as e:
-        print(f"⚠️  Error extracting info from converter {info.get('name', 'unknown')}: {e}")
+        logger.warning("⚠️  Error extracting info from converter %s: %s", info.get('name', 'unknown'), e)
     
     return info
 
+def _process_converter(converter, chain, min_threshold):
+    """
+    Run the bridge filter, native holdings filter and info extraction for one converter
+    
+    Args:
+        converter (dict): Raw converter data from RPC call
+        chain (str): Chain the converter was fetched from
+        min_threshold (float): Minimum native token holdings for the chain
+        
+    Returns:
+        tuple: ('active', info), ('excluded', info), or ('dropped', None) for
+               bridge converters that are sourced from another chain
+    """
+    converter_name = converter.get('fullyqualifiedname', '')
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    # Bridge converters are only counted on the chain that hosts them
+    if converter_name.startswith('Bridge.') and BRIDGE_CONVERTER_CHAINS.get(converter_name) != chain:
+        if debug_enabled:
+            logger.debug("❌ Excluded bridge converter: %s (belongs to %s, not %s)", converter_name, BRIDGE_CONVERTER_CHAINS.get(converter_name), chain)
+        return 'dropped', None
+    
+    # Add source_chain for tracking
+    converter['source_chain'] = chain
+    
+    native_holdings = get_native_token_holdings(converter, chain)
+    info = extract_converter_info(converter)
+    
+    if native_holdings >= min_threshold:
+        if debug_enabled:
+            logger.debug("✅ Included converter: %s (%.0f %s >= %s)", converter_name, native_holdings, chain, min_threshold)
+        return 'active', info
+    
+    if debug_enabled:
+        logger.debug("❌ Excluded converter: %s (%.0f %s < %s)", converter_name, native_holdings, chain, min_threshold)
+    return 'excluded', info
+
 def discover_active_converters(chains=None):
     """
     Main function to discover all active converters across multiple chains
@@ -329,49 +275,64 @@ def discover_active_converters(chains=None):
             'chains': dict of per-chain results
         }
     """
+    global _save_thread
+    
     if chains is None:
         chains = ["VRSC"]
     
-    print(f"🔍 Starting multi-chain converter discovery process for: {chains}")
+    logger.info("🔍 Starting multi-chain converter discovery process for: %s", chains)
     
     # Get current block height for this session
     block_height = get_session_block_height()
     
-    all_raw_converters = []
     chain_results = {}
+    active_converter_info = []
+    excluded_converter_info = []
+    total_count = 0
     
-    # Discover converters on each chain
-    for chain in chains:
-        print(f"\n🔄 Discovering converters on {chain}...")
+    # Fetch converters from all chains concurrently - each chain is a separate daemon,
+    # so the RPC calls are independent and total latency becomes the slowest chain
+    logger.info("🔄 Discovering converters on %s...", ', '.join(chains))
+    with ThreadPoolExecutor(max_workers=max(len(chains), 1)) as executor:
         # Use each chain's native currency as the system_id
-        raw_converters = get_all_converters(system_id=chain, chain=chain)
-        
-        if raw_converters:
-            # Filter out bridge converters that should be sourced from other chains
-            filtered_converters = filter_bridge_converters_by_chain(raw_converters, chain)
-            
-            # Add source_chain to each converter for tracking
-            for converter in filtered_converters:
-                converter['source_chain'] = chain
+        chain_converters = executor.map(lambda c: get_all_converters(system_id=c, chain=c), chains)
+        
+        # Process results in the original chain order as they arrive, so earlier chains
+        # are filtered while later chains' RPC calls are still in flight
+        for chain, raw_converters in zip(chains, chain_converters):
+            if raw_converters:
+                # Single pass per converter: bridge filter, native holdings filter and info extraction
+                min_threshold = get_min_native_tokens(chain)
+                filtered_converters = []
+                for converter in raw_converters:
+                    status, info = _process_converter(converter, chain, min_threshold)
+                    if status == 'dropped':
+                        continue
+                
+                    filtered_converters.append(converter)
+                    if status == 'active':
+                        active_converter_info.append(info)
+                    else:
+                        excluded_converter_info.append(info)
             
-            all_raw_converters.extend(filtered_converters)
-            chain_results[chain] = {
-                'count': len(filtered_converters),
-                'converters': filtered_converters,
-                'total_found': len(raw_converters),
-                'bridge_filtered': len(raw_converters) - len(filtered_converters)
-            }
-            print(f"✅ Found {len(raw_converters)} converters on {chain}, kept {len(filtered_converters)} after bridge filtering")
-        else:
-            chain_results[chain] = {
-                'count': 0,
-                'converters': [],
-                'total_found': 0,
-                'bridge_filtered': 0
-            }
-            print(f"❌ No converters found on {chain}")
-    
-    if not all_raw_converters:
+                total_count += len(filtered_converters)
+                chain_results[chain] = {
+                    'count': len(filtered_converters),
+                    'converters': filtered_converters,
+                    'total_found': len(raw_converters),
+                    'bridge_filtered': len(raw_converters) - len(filtered_converters)
+                }
+                logger.info("✅ Found %d converters on %s, kept %d after bridge filtering", len(raw_converters), chain, len(filtered_converters))
+            else:
+                chain_results[chain] = {
+                    'count': 0,
+                    'converters': [],
+                    'total_found': 0,
+                    'bridge_filtered': 0
+                }
+                logger.warning("❌ No converters found on %s", chain)
+    
+    if not total_count:
         return {
             'active_converters': [],
             'excluded_converters': [],
@@ -383,75 +344,80 @@ def discover_active_converters(chains=None):
             'error': 'Failed to fetch converters from any chain'
         }
     
-    # Filter converters
-    filtered_converters, excluded_converters = filter_converters_by_native_holdings(all_raw_converters)
-    
-    # Extract detailed info for active converters
-    active_converter_info = []
-    for converter in filtered_converters:
-        info = extract_converter_info(converter)
-        active_converter_info.append(info)
-    
-    # Extract info for excluded converters (for reference)
-    excluded_converter_info = []
-    for converter in excluded_converters:
-        info = extract_converter_info(converter)
-        excluded_converter_info.append(info)
-    
     result = {
         'active_converters': active_converter_info,
         'excluded_converters': excluded_converter_info,
-        'total_count': len(all_raw_converters),
+        'total_count': total_count,
         'active_count': len(active_converter_info),
         'excluded_count': len(excluded_converter_info),
         'block_height': block_height,
         'chains': chain_results
     }
     
-    print(f"\n✅ Multi-chain converter discovery complete:")
-    print(f"   Chains processed: {len(chains)}")
-    print(f"   Total found: {result['total_count']}")
-    print(f"   Active (included): {result['active_count']}")
-    print(f"   Excluded: {result['excluded_count']}")
-    print(f"   Block height: {result['block_height']}")
-    
-    # Show per-chain breakdown
-    for chain, chain_data in chain_results.items():
-        print(f"   {chain}: {chain_data['count']} converters")
+    logger.info(
+        "✅ Multi-chain converter discovery complete: %d chains processed, %d found, %d active, %d excluded at block %s (%s)",
+        len(chains), result['total_count'], result['active_count'], result['excluded_count'], result['block_height'],
+        ", ".join(f"{chain}: {chain_data['count']}" for chain, chain_data in chain_results.items())
+    )
     
-    # Automatically save the results to JSON file
-    save_success = save_converter_discovery(result)
-    if save_success:
-        print(f"💾 Results saved to converter_discovery.json")
-    else:
-        print(f"❌ Failed to save results to converter_discovery.json")
+    # Automatically save the results to JSON file in the background - callers only need
+    # the in-memory result, and the atomic rename keeps readers off partial files.
+    # Not a daemon thread, so a CLI run still finishes writing before exit.
+    _save_thread = threading.Thread(target=_save_converter_discovery_background, args=(result,))
+    _save_thread.start()
     
     return result
 
+def wait_for_converter_discovery_save():
+    """Block until the most recent background save of the discovery file has finished"""
+    save_thread = _save_thread
+    if save_thread is not None:
+        save_thread.join()
+
+def _save_converter_discovery_background(discovery_result):
+    """Save discovery results off the request path, one write at a time"""
+    with _save_lock:
+        if save_converter_discovery(discovery_result):
+            logger.info("💾 Results saved to converter_discovery.json")
+        else:
+            logger.error("❌ Failed to save results to converter_discovery.json")
+
 def save_converter_discovery(discovery_result, filename=None):
     """
     Save converter discovery results to a JSON file
     
     Args:
         discovery_result (dict): Result from discover_active_converters()
-        filename (str): Output filename
+        filename (str): Output filename (default: CONVERTER_DISCOVERY_FILE)
     """
     try:
-        # Use relative path if no filename provided
         if filename is None:
-            import os
-            filename = os.path.join(os.path.dirname(__file__), 'converter_discovery.json')
-        
-        with open(filename, 'w') as f:
-            json.dump(discovery_result, f, indent=2, default=str)
-        print(f"💾 Converter discovery saved to: {filename}")
+            filename = CONVERTER_DISCOVERY_FILE
+        
+        # orjson serializes straight to bytes, much faster than json.dump for the raw RPC payloads
+        payload = orjson.dumps(discovery_result, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        
+        # Write to a temp file in the same directory and rename it into place,
+        # so readers never see a partially written file
+        fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.chmod(tmp_filename, 0o644)  # mkstemp creates 0600
+            os.replace(tmp_filename, filename)
+        except Exception:
+            os.unlink(tmp_filename)
+            raise
+        
+        logger.info("💾 Converter discovery saved to: %s", filename)
         return True
     except Exception as e:
-        print(f"❌ Error saving converter discovery: {e}")
+        logger.error("❌ Error saving converter discovery: %s", e)
         return False
 
 if __name__ == "__main__":
     # Test the converter discovery functionality
+    logging.basicConfig(level=logging.INFO)
     print("🧪 Testing Converter Discovery Module")
     print("=" * 50)
     
@@ -482,8 +448,8 @@ if __name__ == "__main__":
         for converter in discovery['excluded_converters']:
             print(f"  - {converter['name']}")
         
-        # Save results
-        save_converter_discovery(discovery)
+        # Results are saved by discover_active_converters in the background; wait for that write
+        wait_for_converter_discovery_save()
         
     finally:
         # Clear session
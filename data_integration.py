@@ -5,10 +5,14 @@ Integrates validated data extraction modules with FastAPI
 Uses proven working code from all_converters_pairs_working.py and price_inversion.py
 """
 
-import json
 import logging
+import threading
+import time
+import orjson
 from datetime import datetime
 from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import sys
 import os
 from dotenv import load_dotenv
@@ -16,25 +20,28 @@ from dotenv import load_dotenv
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from block_height import get_session_block_height, clear_session, start_new_session
+from block_height import get_session_block_height, clear_session, session_scope
 from price_inversion import apply_universal_price_inversion
+from liquidity_calculator import compute_all_pair_liquidity, get_converter_native_ratios, index_converters_by_name
+from converter_discovery import CONVERTER_DISCOVERY_FILE
 
 logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 
+# Chains configured in the environment (scanned once, after .env is loaded)
+AVAILABLE_CHAINS = tuple(
+    key[:-len('_BLOCKS_PER_DAY')] for key in os.environ if key.endswith('_BLOCKS_PER_DAY')
+)
+
 def get_available_chains() -> List[str]:
     """Get list of available chains from environment variables"""
-    chains = []
-    for key in os.environ:
-        if key.endswith('_BLOCKS_PER_DAY'):
-            chain = key.replace('_BLOCKS_PER_DAY', '')
-            chains.append(chain)
-    return chains
+    return list(AVAILABLE_CHAINS)
 
+@lru_cache(maxsize=32)
 def get_chain_config(chain: str) -> Dict:
-    """Get configuration for a specific chain from environment variables"""
+    """Get configuration for a specific chain from environment variables (cached per chain)"""
     blocks_per_day = int(os.getenv(f"{chain}_BLOCKS_PER_DAY", "1440"))
     block_time_seconds = int(os.getenv(f"{chain}_BLOCK_TIME_SECONDS", "60"))
     name = os.getenv(f"{chain}_NAME", chain)
@@ -45,66 +52,82 @@ def get_chain_config(chain: str) -> Dict:
         "name": name
     }
 
+# Hardcoded chain mappings for reliability (fallback from .env approach)
+BRIDGE_CHAIN_MAPPINGS = {
+    'Bridge.vARRR': 'VARRR',
+    'Bridge.vDEX': 'VDEX', 
+    'Bridge.vCHIPS': 'CHIPS',
+    'Bridge.CHIPS': 'CHIPS'
+}
+
+# Native converters are named <name>.<chain>
+NATIVE_CHAIN_SUFFIXES = {
+    'CHIPS': 'CHIPS',
+    'VARRR': 'VARRR',
+    'VDEX': 'VDEX'
+}
+
 def get_chain_for_converter(converter_name: str) -> str:
     """Determine the target chain for a converter based on its name"""
-    # Hardcoded chain mappings for reliability (fallback from .env approach)
-    bridge_mappings = {
-        'Bridge.vARRR': 'VARRR',
-        'Bridge.vDEX': 'VDEX', 
-        'Bridge.vCHIPS': 'CHIPS',
-        'Bridge.CHIPS': 'CHIPS'
-    }
-    
-    native_mappings = {
-        '.CHIPS': 'CHIPS',
-        '.VARRR': 'VARRR',
-        '.VDEX': 'VDEX'
-    }
-    
     # Check for exact bridge converter matches first
-    if converter_name in bridge_mappings:
-        return bridge_mappings[converter_name]
+    if converter_name in BRIDGE_CHAIN_MAPPINGS:
+        return BRIDGE_CHAIN_MAPPINGS[converter_name]
     
-    # Check for native chain converters
-    for suffix, chain in native_mappings.items():
-        if converter_name.endswith(suffix):
-            return chain
+    # Check for native chain converters by the part after the last dot
+    _, dot, suffix = converter_name.rpartition('.')
+    if dot:
+        return NATIVE_CHAIN_SUFFIXES.get(suffix, "VRSC")
     
     # Default to VRSC
     return "VRSC"
 
-def get_currency_volume_info(currency, from_block, end_block, interval, volume_currency, target_chain=None, output_file='volume_response.json'):
+def _parse_volume_response(result):
     """
-    Get volume information - using existing working RPC connection
-    Copied from validated all_converters_pairs_working.py
+    Extract (volume_pairs, total_volume) from a getcurrencystate result
+    
+    Returns:
+        tuple: (volume_pairs, total_volume), or (None, None) if the result has no conversion data
     """
-    from verus_rpc import make_rpc_call
+    # Failed RPC calls come back as None - reject anything that isn't the v1 result list
+    if not result or not isinstance(result, list):
+        return None, None
     
-    # Determine correct chain based on converter name if not provided
-    if not target_chain:
-        target_chain = get_chain_for_converter(currency)
+    # Look for conversion data in the result list - v1 working logic
+    conversion_data = None
+    total_volume = None
     
-    # Get chain configuration from .env
-    chain_config = get_chain_config(target_chain)
-    if not chain_config:
-        return None, None
+    # Find the conversion data and total volume in the result list
+    for item in result:
+        if isinstance(item, dict):
+            if 'conversiondata' in item:
+                conversion_data = item['conversiondata']
+            if 'totalvolume' in item:
+                total_volume = item['totalvolume']
     
-    # Use chain-specific blocks per day instead of hardcoded interval
-    chain_blocks_per_day = chain_config.get('blocks_per_day', interval)
+    # Check if we found the conversion data
+    if isinstance(conversion_data, dict) and 'volumepairs' in conversion_data:
+        return conversion_data['volumepairs'], total_volume
     
-    # Determine the native currency for the target chain
-    native_currencies = {
-        "VRSC": "VRSC",
-        "CHIPS": "CHIPS", 
-        "VARRR": "vARRR",
-        "VDEX": "vDEX"
-    }
+    return None, None
+
+def get_chain_volume_info_batch(target_chain, volume_requests):
+    """
+    Get volume information for many converter/volume currency combinations on one chain,
+    using a single getinfo call and batched getcurrencystate RPC requests
+    
+    Args:
+        target_chain (str): Chain the converters live on
+        volume_requests (list): List of (converter_name, volume_currency) tuples
+        
+    Returns:
+        dict: (converter_name, volume_currency) -> (volume_pairs, total_volume)
+    """
+    from verus_rpc import make_rpc_call, make_rpc_batch
     
-    # Use chain's native currency instead of hardcoded volume_currency
-    chain_native_currency = native_currencies.get(target_chain, volume_currency)
+    volume_info = {request: (None, None) for request in volume_requests}
     
-    # Calculate proper block range using chain-specific configuration
-    # Get current block height for the target chain
+    # Chain-specific block range, computed once per chain
+    chain_blocks_per_day = get_chain_config(target_chain)['blocks_per_day']
     current_height_result = make_rpc_call(
         chain=target_chain,
         method="getinfo",
@@ -112,81 +135,48 @@ def get_currency_volume_info(currency, from_block, end_block, interval, volume_c
     )
     
     if not current_height_result or 'blocks' not in current_height_result:
-        return None, None
+        return volume_info
     
     current_height = current_height_result['blocks']
-    calculated_start_block = current_height - chain_blocks_per_day
-    calculated_end_block = current_height
+    block_range_param = f"{current_height - chain_blocks_per_day}, {current_height}, {chain_blocks_per_day}"
     
-    # Use consistent RPC call format for all chains (like API_Rebuild_v1_complete)
-    block_range_param = f"{calculated_start_block}, {calculated_end_block}, {chain_blocks_per_day}"
-    result = make_rpc_call(
-        chain=target_chain,
-        method="getcurrencystate",
-        params=[currency, block_range_param, volume_currency]
-    )
+    results = make_rpc_batch(target_chain, [
+        ("getcurrencystate", [converter_name, block_range_param, volume_currency])
+        for converter_name, volume_currency in volume_requests
+    ])
     
-    # Create response format to match original
-    response = {'result': result} if result else None
+    for request, result in zip(volume_requests, results):
+        volume_info[request] = _parse_volume_response(result)
     
-    
-    try:
-        # Check if the response contains the expected data - restore v1 logic
-        if not isinstance(response, dict) or 'result' not in response or not isinstance(response['result'], list):
-            return None, None
-            
-        result = response['result']
-        
-        # Look for conversion data in the result list - v1 working logic
-        conversion_data = None
-        total_volume = None
-        
-        # Find the conversion data and total volume in the result list
-        for item in result:
-            if isinstance(item, dict):
-                if 'conversiondata' in item:
-                    conversion_data = item['conversiondata']
-                if 'totalvolume' in item:
-                    total_volume = item['totalvolume']
-        
-        # Check if we found the conversion data
-        if conversion_data and 'volumepairs' in conversion_data:
-            volume_pairs = conversion_data['volumepairs']
-            return volume_pairs, total_volume
-        else:
-            return None, None
-    except Exception as e:
-        logger.error(f"Error extracting volume data: {e}")
-        return None, None
+    return volume_info
 
-def find_pair_volume(volume_pairs, from_currency, to_currency):
-    """Find volume for specific currency pair"""
-    if not volume_pairs:
+def index_volume_pairs(volume_pairs):
+    """Index volume pairs by (currency, convertto), keeping the first entry for each pair"""
+    pair_index = {}
+    for pair in volume_pairs or ():
+        pair_index.setdefault((pair.get('currency'), pair.get('convertto')), pair)
+    return pair_index
+
+def find_pair_volume(pair_index, from_currency, to_currency):
+    """Find volume for specific currency pair in an index from index_volume_pairs"""
+    pair = pair_index.get((from_currency, to_currency)) if pair_index else None
+    if pair is None:
         return 0
     
-    for pair in volume_pairs:
-        if (pair.get('currency') == from_currency and 
-            pair.get('convertto') == to_currency):
-            return pair.get('volume', 0)
-    
-    return 0
+    return pair.get('volume', 0)
 
-def find_pair_ohlc(volume_pairs, from_currency, to_currency):
-    """Find OHLC data for specific currency pair"""
-    if not volume_pairs:
+def find_pair_ohlc(pair_index, from_currency, to_currency):
+    """Find OHLC data for specific currency pair in an index from index_volume_pairs"""
+    pair = pair_index.get((from_currency, to_currency)) if pair_index else None
+    if pair is None:
         return {'open': 0, 'high': 0, 'low': 0, 'close': 0}
     
-    for pair in volume_pairs:
-        if (pair.get('currency') == from_currency and 
-            pair.get('convertto') == to_currency):
-            return {
-                'open': pair.get('open', 0),
-                'high': pair.get('high', 0),
-                'low': pair.get('low', 0),
-                'close': pair.get('close', 0)
-            }
-    
-    return {'open': 0, 'high': 0, 'low': 0, 'close': 0}
+    return {
+        'open': pair.get('open', 0),
+        'high': pair.get('high', 0),
+        'low': pair.get('low', 0),
+        'close': pair.get('close', 0)
+    }
 
 def load_converter_data(multi_chain=False):
     """Load converter discovery data with optional multi-chain support
@@ -199,10 +189,8 @@ def load_converter_data(multi_chain=False):
         List of active converter data
     """
     try:
-        # Use relative path that works on any server
-        discovery_file = os.path.join(os.path.dirname(__file__), 'converter_discovery.json')
-        with open(discovery_file, 'r') as f:
-            data = json.load(f)
+        with open(CONVERTER_DISCOVERY_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
         
         if 'active_converters' in data:
             logger.info(f"Loaded {len(data['active_converters'])} converters from existing discovery file")
@@ -213,8 +201,6 @@ def load_converter_data(multi_chain=False):
         try:
             # Import and run converter discovery
             import converter_discovery
-            import time
-            import os
             
             # Choose chains based on multi_chain parameter
             if multi_chain:
@@ -226,24 +212,12 @@ def load_converter_data(multi_chain=False):
             
             result = converter_discovery.discover_active_converters(chains=chains)
             
-            # Wait a moment for file to be written
-            time.sleep(1)
-            
-            # Verify file was created
-            discovery_file = os.path.join(os.path.dirname(__file__), 'converter_discovery.json')
-            if not os.path.exists(discovery_file):
-                logger.error("converter_discovery.json was not created after generation")
-                return []
-            
-            # Try loading again after generation
-            with open(discovery_file, 'r') as f:
-                data = json.load(f)
-            
-            if 'active_converters' in data:
-                logger.info(f"✅ Auto-generated and loaded {len(data['active_converters'])} converters")
-                return data['active_converters']
+            # Use the in-memory result; the discovery file is written in the background
+            if 'active_converters' in result:
+                logger.info(f"✅ Auto-generated and loaded {len(result['active_converters'])} converters")
+                return result['active_converters']
             else:
-                logger.error("Generated file does not contain 'active_converters' key")
+                logger.error(f"Converter discovery did not return 'active_converters': {result.get('error')}")
                 return []
         except Exception as gen_error:
             logger.error(f"Failed to auto-generate converter discovery: {gen_error}")
@@ -280,12 +254,12 @@ def get_converter_currency_symbols(converter):
     currencies = get_converter_currencies(converter)
     return [curr['symbol'] for curr in currencies]
 
-def get_currency_id_by_symbol(currencies, symbol):
-    """Get currency ID by symbol from currency list"""
+def get_currency_ids_by_symbol(currencies):
+    """Map each symbol in a currency list to its currency ID (first entry wins)"""
+    currency_ids = {}
     for curr in currencies:
-        if curr['symbol'] == symbol:
-            return curr['currency_id']
-    return ''
+        currency_ids.setdefault(curr['symbol'], curr['currency_id'])
+    return currency_ids
 
 def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
     """
@@ -297,13 +271,14 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
     Returns:
         Dict containing all pairs data with metadata
     """
+    # Without a caller-provided session, run the extraction in its own session
+    if not session_id:
+        with session_scope() as scoped_session_id:
+            return extract_all_pairs_data(session_id=scoped_session_id)
+    
     try:
         logger.info("Starting comprehensive pairs data extraction...")
         
-        # Start new session if not provided
-        if not session_id:
-            session_id = start_new_session()
-        
         # Get session data
         current_block = get_session_block_height()
         
@@ -322,14 +297,42 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
         
         all_pairs = []
         
-        # Process each converter using validated methodology
-        for converter_idx, converter in enumerate(converters, 1):
+        # Collect the volume calls for every converter (validated 5-call methodology),
+        # grouped by chain so each chain gets one batched RPC request
+        converter_jobs = []
+        chain_requests = {}
+        
+        for converter in converters:
             converter_name = converter.get('name', 'Unknown')
             currencies = get_converter_currencies(converter)
+            target_chain = get_chain_for_converter(converter_name)
+            converter_jobs.append((converter_name, currencies, target_chain))
+            
+            if len(currencies) >= 2:
+                chain_requests.setdefault(target_chain, []).extend(
+                    (converter_name, curr['symbol']) for curr in currencies
+                )
+        
+        # Chains are separate daemons, so fetch their batches concurrently
+        volume_results = {}
+        with ThreadPoolExecutor(max_workers=max(len(chain_requests), 1)) as executor:
+            for target_chain, volume_requests in chain_requests.items():
+                logger.info(f"Fetching {len(volume_requests)} volume calls from {target_chain} in one batch")
+            for chain_volume_info in executor.map(get_chain_volume_info_batch, chain_requests.keys(), chain_requests.values()):
+                volume_results.update(chain_volume_info)
+        
+        # Converter -> native currency ratios for the liquidity figures, batched per chain as well
+        converters_index = index_converters_by_name(converters)
+        native_ratios = get_converter_native_ratios(
+            [converter_name for converter_name, currencies, _ in converter_jobs if len(currencies) >= 2],
+            converters, converters_index=converters_index
+        )
+        
+        # Process each converter using validated methodology
+        for converter_idx, (converter_name, currencies, target_chain) in enumerate(converter_jobs, 1):
             currency_symbols = [curr['symbol'] for curr in currencies]
             
-            # Determine target chain and get its configuration
-            target_chain = get_chain_for_converter(converter_name)
+            # Get chain configuration for logging the chain-specific block range
             chain_config = get_chain_config(target_chain)
             blocks_per_day = chain_config["blocks_per_day"]
             
@@ -337,44 +340,50 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
             start_block = current_block - blocks_per_day
             end_block = current_block
             
-            logger.info(f"Processing converter {converter_idx}/{len(converters)}: {converter_name}")
-            logger.info(f"Using {target_chain} chain with block range: {start_block} to {end_block} ({blocks_per_day} blocks/day)")
+            logger.info("Processing converter %s/%s: %s", converter_idx, len(converters), converter_name)
+            logger.info("Using %s chain with block range: %s to %s (%s blocks/day)", target_chain, start_block, end_block, blocks_per_day)
             
             if len(currencies) < 2:
                 logger.warning(f"Skipping {converter_name} - only {len(currencies)} currencies")
                 continue
             
-            # Make calls for each currency in this converter (validated 5-call methodology)
             all_volume_data = {}
             
-            for currency_info in currencies:
-                currency_symbol = currency_info['symbol']
-                logger.debug(f"Calling with {currency_symbol} as volume currency for {converter_name}")
-                
-                volume_pairs, total_volume = get_currency_volume_info(
-                    converter_name, start_block, end_block, blocks_per_day, currency_symbol, target_chain
-                )
+            for currency_symbol in currency_symbols:
+                volume_pairs, total_volume = volume_results.get((converter_name, currency_symbol), (None, None))
                 
                 if volume_pairs is not None:
                     all_volume_data[currency_symbol] = {
                         'volume_pairs': volume_pairs,
+                        'pair_index': index_volume_pairs(volume_pairs),
                         'total_volume': total_volume
                     }
-                    logger.debug(f"Got {len(volume_pairs)} pairs for {currency_symbol}")
+                    logger.debug("Got %s pairs for %s", len(volume_pairs), currency_symbol)
                 else:
                     logger.warning(f"Failed to get volume data for {currency_symbol} in {converter_name}")
             
+            currency_ids = get_currency_ids_by_symbol(currencies)
+            
+            # Only pairs with volume in the base (from side) or target (to side) call
+            # can produce output, so collect them up front and skip the rest
+            traded_pairs = set()
+            for currency_symbol, volume_data in all_volume_data.items():
+                for pair_key, pair in volume_data['pair_index'].items():
+                    if currency_symbol in pair_key and pair.get('volume', 0) > 0:
+                        traded_pairs.add(pair_key)
+            
             # Extract pairs for this converter using validated methodology
+            converter_pair_liquidity = None
             for base_currency in currency_symbols:
                 for target_currency in currency_symbols:
-                    if base_currency != target_currency:
+                    if base_currency != target_currency and (base_currency, target_currency) in traded_pairs:
                         
                         # Get raw base volume (from base currency call)
                         raw_base_volume = 0
                         base_data = all_volume_data.get(base_currency)
                         if base_data:
                             raw_base_volume = find_pair_volume(
-                                base_data['volume_pairs'], base_currency, target_currency
+                                base_data['pair_index'], base_currency, target_currency
                             )
                         
                         # Get raw target volume (from target currency call)
@@ -383,14 +392,7 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
                         target_data = all_volume_data.get(target_currency)
                         if target_data:
                             raw_target_volume = find_pair_volume(
-                                target_data['volume_pairs'], base_currency, target_currency
-                            )
-                        
-                        # Get OHLC data (from target currency call for consistency)
-                        ohlc_data = {'open': 0, 'high': 0, 'low': 0, 'close': 0}
-                        if target_data:
-                            ohlc_data = find_pair_ohlc(
-                                target_data['volume_pairs'], base_currency, target_currency
+                                target_data['pair_index'], base_currency, target_currency
                             )
                         
                         # Calculate base and target volumes using corrected methodology
@@ -401,13 +403,25 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
                         
                         # Only include pairs with volume
                         if calculated_base_volume > 0 or calculated_target_volume > 0:
+                            # Get OHLC data (from target currency call for consistency)
+                            ohlc_data = {'open': 0, 'high': 0, 'low': 0, 'close': 0}
+                            if target_data:
+                                ohlc_data = find_pair_ohlc(
+                                    target_data['pair_index'], base_currency, target_currency
+                                )
+                            
                             # Get currency IDs for enhanced mapping
-                            base_currency_id = get_currency_id_by_symbol(currencies, base_currency)
-                            target_currency_id = get_currency_id_by_symbol(currencies, target_currency)
+                            base_currency_id = currency_ids[base_currency]
+                            target_currency_id = currency_ids[target_currency]
                             
-                            # Calculate liquidity during data extraction
-                            from liquidity_calculator import get_pair_liquidity
-                            pair_liquidity_usd = get_pair_liquidity(converter_name, base_currency, target_currency, converters)
+                            # Calculate liquidity during data extraction - all of the converter's
+                            # pairs at once, the first time one of them has volume
+                            if converter_pair_liquidity is None:
+                                converter_pair_liquidity = compute_all_pair_liquidity(
+                                    converter_name, converters, native_ratio=native_ratios.get(converter_name),
+                                    converters_index=converters_index
+                                )
+                            pair_liquidity_usd = converter_pair_liquidity.get((base_currency, target_currency), 0.0)
                             
                             pair_data = {
                                 'converter': converter_name,
@@ -432,9 +446,7 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
                             }
                             
                             # Apply universal price inversion to convert blockchain rates to trading pair rates
-                            inverted_pair_data = apply_universal_price_inversion(pair_data)
-                            
-                            all_pairs.append(inverted_pair_data)
+                            all_pairs.append(apply_universal_price_inversion(pair_data, in_place=True))
         
         result = {
             'success': True,
@@ -463,6 +475,31 @@ def extract_all_pairs_data(session_id: Optional[str] = None) -> Dict:
             'pairs': []
         }
 
+# Short-lived shared sweep for get_ticker_data: concurrent callers wait on the lock and
+# reuse one extraction instead of each running a full RPC sweep
+TICKER_DATA_CACHE_TTL = 5.0
+_ticker_data_cache = {"data": None, "fetched_at": 0.0}
+_ticker_data_lock = threading.Lock()
+
+def _get_shared_pairs_data() -> Dict:
+    """
+    Run extract_all_pairs_data, reusing a result younger than TICKER_DATA_CACHE_TTL
+    
+    Returns:
+        Dict: Result of extract_all_pairs_data
+    """
+    with _ticker_data_lock:
+        now = time.monotonic()
+        if _ticker_data_cache["data"] is not None and now - _ticker_data_cache["fetched_at"] < TICKER_DATA_CACHE_TTL:
+            return _ticker_data_cache["data"]
+        
+        data = extract_all_pairs_data()
+        
+        # Failed extractions are not reused
+        if 'error' not in data:
+            _ticker_data_cache.update(data=data, fetched_at=time.monotonic())
+        return data
+
 def get_ticker_data(format_type: str = "raw") -> Dict:
     """
     Get ticker data in specified format
@@ -474,8 +511,8 @@ def get_ticker_data(format_type: str = "raw") -> Dict:
         Dict containing ticker data
     """
     try:
-        # Extract all pairs data
-        data = extract_all_pairs_data()
+        # Shared short-lived sweep, so concurrent format requests don't each do a full RPC sweep
+        data = _get_shared_pairs_data()
         
         if 'error' in data:
             return data
@@ -1,7 +1,15 @@
 import os
-import json
+import threading
+import time
+import orjson
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# Minimum native token thresholds by chain, read from .env once per process
+_min_native_tokens_cache = {}
+_min_native_tokens_lock = threading.Lock()
+_min_native_tokens_env_loaded = False
+
 def get_min_native_tokens(chain):
     """
     Get minimum native token threshold for a specific chain from environment variables
@@ -12,22 +20,40 @@ def get_min_native_tokens(chain):
     Returns:
         float: Minimum native token threshold for the chain
     """
+    global _min_native_tokens_env_loaded
     
-    load_dotenv(".env", override=True)
-    
-    # Try chain-specific threshold first
-    env_key = f"{chain}_MIN_NATIVE_TOKENS"
-    threshold = os.getenv(env_key)
-    
+    threshold = _min_native_tokens_cache.get(chain)
     if threshold is not None:
-        return float(threshold)
+        return threshold
     
-    # Fall back to global default
-    global_default = os.getenv("DEFAULT_MIN_NATIVE_TOKENS", "100")
-    return float(global_default)
+    with _min_native_tokens_lock:
+        if not _min_native_tokens_env_loaded:
+            load_dotenv(".env", override=True)
+            _min_native_tokens_env_loaded = True
+        
+        # Try chain-specific threshold first, then fall back to global default
+        threshold = os.environ.get(f"{chain}_MIN_NATIVE_TOKENS")
+        if threshold is None:
+            threshold = os.environ.get("DEFAULT_MIN_NATIVE_TOKENS", "100")
+        
+        threshold = float(threshold)
+        _min_native_tokens_cache[chain] = threshold
+        return threshold
 
-# Global variable to cache the currency mapping
+# Global variable to cache the currency mapping, reloaded when the file changes
+CURRENCY_MAPPINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'currency_mappings.json')
 _currency_mapping_cache = None
+_currency_mapping_mtime = None
+_vrsc_symbol_index = None
+_display_symbol_index = None
+_currency_mapping_checked_at = 0.0
+_currency_mapping_lock = threading.Lock()
+
+# Seconds between checks of the mapping file for changes
+CURRENCY_MAPPINGS_CHECK_INTERVAL = 1.0
+
+# Fields every loaded mapping entry is guaranteed to have (None when absent from the file)
+CURRENCY_MAPPING_FIELDS = ('vrsc_symbol', 'eth_symbol', 'address')
 
 def load_currency_mappings():
     """Load currency mappings from JSON configuration file
@@ -35,26 +61,80 @@ def load_currency_mappings():
     Returns:
         dict: Currency contract mapping data
     """
-    global _currency_mapping_cache
+    global _currency_mapping_cache, _currency_mapping_mtime, _vrsc_symbol_index, _display_symbol_index, _currency_mapping_checked_at
     
-    if _currency_mapping_cache is not None:
+    # Helpers run this thousands of times per request; stat the file at most once per interval
+    now = time.monotonic()
+    if _currency_mapping_cache is not None and now - _currency_mapping_checked_at < CURRENCY_MAPPINGS_CHECK_INTERVAL:
         return _currency_mapping_cache
     
     try:
-        config_path = os.path.join(os.path.dirname(__file__), 'currency_mappings.json')
-        with open(config_path, 'r') as f:
-            data = json.load(f)
-            _currency_mapping_cache = data.get('currency_contract_mapping', {})
+        mtime = os.stat(CURRENCY_MAPPINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    _currency_mapping_checked_at = now
+    
+    if _currency_mapping_cache is not None and mtime == _currency_mapping_mtime:
+        return _currency_mapping_cache
+    
+    with _currency_mapping_lock:
+        # Another thread may have reloaded while we waited
+        if _currency_mapping_cache is not None and mtime == _currency_mapping_mtime:
             return _currency_mapping_cache
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Warning: Could not load currency mappings: {e}")
-        _currency_mapping_cache = {}
+        
+        try:
+            with open(CURRENCY_MAPPINGS_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
+                mapping = data.get('currency_contract_mapping', {})
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            print(f"Warning: Could not load currency mappings: {e}")
+            # Missing or half-written file: keep serving the last good mapping and leave the
+            # cached mtime alone, so the next check retries the load
+            if _currency_mapping_cache is not None:
+                return _currency_mapping_cache
+            mapping = {}
+            mtime = None
+        
+        # Validate entries once here so the lookup helpers can subscript fields directly
+        validated = {}
+        for currency_id, contract_info in mapping.items():
+            if not contract_info or not isinstance(contract_info, dict):
+                print(f"Warning: Skipping malformed currency mapping for {currency_id}")
+                continue
+            entry = dict.fromkeys(CURRENCY_MAPPING_FIELDS)
+            entry.update(contract_info)
+            validated[currency_id] = entry
+        
+        # Reverse vrsc_symbol -> currency ID index; the first ID wins, as with a scan of the mapping
+        index = {}
+        for currency_id, contract_info in validated.items():
+            index.setdefault(contract_info['vrsc_symbol'], currency_id)
+        
+        # Currency ID -> display symbol: ETH symbol when exported to Ethereum, VRSC symbol otherwise
+        display_symbols = {
+            currency_id: contract_info['eth_symbol'] if contract_info['address'] else contract_info['vrsc_symbol']
+            for currency_id, contract_info in validated.items()
+        }
+        
+        reloaded = _currency_mapping_cache is not None
+        _vrsc_symbol_index = index
+        _display_symbol_index = display_symbols
+        _currency_mapping_mtime = mtime
+        _currency_mapping_cache = validated
+        
+        # Memoized lookups hold values from the previous mapping
+        if reloaded:
+            _get_ticker_by_id_cached.cache_clear()
+        
         return _currency_mapping_cache
 
 # Required helper functions for currency name normalization
 def normalize_currency_name(name):
     """Normalize currency name - DISABLED for now to use actual currency names
     
+    Kept for backward compatibility only; call sites in this repo use the
+    raw name directly. Deprecated.
+    
     Args:
         name (str): Currency name to normalize
         
@@ -73,14 +153,20 @@ def get_ticker_by_id(currency_id):
     Returns:
         str: Ticker symbol if found, otherwise the original ID
     """
-    # Load currency mappings dynamically
-    currency_contract_mapping = load_currency_mappings()
+    # Load currency mappings dynamically (clears the memoized lookups if the file changed)
+    load_currency_mappings()
+    return _get_ticker_by_id_cached(currency_id)
+
+@lru_cache(maxsize=1024)
+def _get_ticker_by_id_cached(currency_id):
+    """Memoized get_ticker_by_id lookup against the currently loaded mapping"""
+    currency_contract_mapping = _currency_mapping_cache
     
     # First try to look up in our currency_contract_mapping
     contract_info = currency_contract_mapping.get(currency_id)
-    if contract_info and isinstance(contract_info, dict):
+    if contract_info is not None:
         # Use VRSC symbol as the default ticker
-        return contract_info.get('vrsc_symbol')
+        return contract_info['vrsc_symbol']
     
     # If not found, extract from the ID name if possible
     if '.' in currency_id:
@@ -100,8 +186,8 @@ def get_mapped_eth_address(currency_id):
     """
     currency_contract_mapping = load_currency_mappings()
     contract_info = currency_contract_mapping.get(currency_id)
-    if contract_info and isinstance(contract_info, dict):
-        return contract_info.get('address')
+    if contract_info is not None:
+        return contract_info['address']
     return None
 
 def get_currency_id_by_name(currency_name):
@@ -113,13 +199,8 @@ def get_currency_id_by_name(currency_name):
     Returns:
         str: Currency ID or None if not found
     """
-    currency_contract_mapping = load_currency_mappings()
-    for currency_id, contract_info in currency_contract_mapping.items():
-        if isinstance(contract_info, dict):
-            vrsc_symbol = contract_info.get('vrsc_symbol')
-            if vrsc_symbol == currency_name:
-                return currency_id
-    return None
+    load_currency_mappings()
+    return _vrsc_symbol_index.get(currency_name)
 
 def get_mapped_eth_symbol(currency_name):
     """Get Ethereum symbol for a currency name from mapping
@@ -130,15 +211,16 @@ def get_mapped_eth_symbol(currency_name):
     Returns:
         str: ETH symbol or None if not found
     """
+    currency_contract_mapping = load_currency_mappings()
+    
     # First get the currency ID from the name
-    currency_id = get_currency_id_by_name(currency_name)
+    currency_id = _vrsc_symbol_index.get(currency_name)
     if not currency_id:
         return None
         
-    currency_contract_mapping = load_currency_mappings()
     contract_info = currency_contract_mapping.get(currency_id)
-    if contract_info and isinstance(contract_info, dict):
-        return contract_info.get('eth_symbol')
+    if contract_info is not None:
+        return contract_info['eth_symbol']
     return None
 
 def get_mapped_vrsc_symbol(currency_id):
@@ -152,8 +234,8 @@ def get_mapped_vrsc_symbol(currency_id):
     """
     currency_contract_mapping = load_currency_mappings()
     contract_info = currency_contract_mapping.get(currency_id)
-    if contract_info and isinstance(contract_info, dict):
-        return contract_info.get('vrsc_symbol')
+    if contract_info is not None:
+        return contract_info['vrsc_symbol']
     return None
 
 def get_symbol_for_currency(currency_id):
@@ -165,16 +247,8 @@ def get_symbol_for_currency(currency_id):
     Returns:
         str: ETH symbol if currency is exported to Ethereum, VRSC symbol otherwise, or None if not found
     """
-    currency_contract_mapping = load_currency_mappings()
-    contract_info = currency_contract_mapping.get(currency_id)
-    if contract_info and isinstance(contract_info, dict):
-        # If currency has an Ethereum contract address, use ETH symbol
-        if contract_info.get('address'):
-            return contract_info.get('eth_symbol')
-        # Otherwise use VRSC symbol
-        else:
-            return contract_info.get('vrsc_symbol')
-    return None
+    load_currency_mappings()
+    return _display_symbol_index.get(currency_id)
 
 def is_currency_exported_to_ethereum(currency_id):
     """Check if currency is exported to Ethereum (has contract address)
@@ -190,7 +264,7 @@ def is_currency_exported_to_ethereum(currency_id):
 
 # Excluded currency IDs - these should not appear in CoinGecko/CoinMarketCap endpoints
 # Filtering is done by currency ID
-excluded_currency_ids = [
+excluded_currency_ids = frozenset([
     "i3f7tSctFkiPpiedY8QR5Tep9p4qDVebDx",  # Bridge.vETH
     "iG1jouaqSJayNb9LCqPzb3yFYD3kUpY2P2",  # whales
     "iHnYAmrS45Hb8GVgyzy7nVQtZ5vttJ9N3X",  # SUPERVRSC
@@ -210,7 +284,7 @@ excluded_currency_ids = [
 
 
 
-]
+])
 
 def is_converter_currency(currency_id):
     """
@@ -233,14 +307,34 @@ def get_currency_info_by_id(currency_id):
     Returns:
         dict: Currency info with ticker and contract address if available
     """
-    # Get ticker from currency_names
-    ticker = get_ticker_by_id(currency_id)
+    return bulk_currency_info([currency_id])[currency_id]
+
+def bulk_currency_info(currency_ids):
+    """Get complete currency information for many currency IDs in one pass
     
-    # Get contract address if available
-    contract_address = get_mapped_eth_address(currency_id)
+    Args:
+        currency_ids (iterable): Currency IDs to look up
+        
+    Returns:
+        dict: Currency ID -> currency info, as returned by get_currency_info_by_id
+    """
+    currency_contract_mapping = load_currency_mappings()
+    
+    currency_info = {}
+    for currency_id in currency_ids:
+        # One mapping lookup per ID; ticker and address come from the same entry
+        contract_info = currency_contract_mapping.get(currency_id)
+        if contract_info is not None:
+            ticker = contract_info['vrsc_symbol']
+            contract_address = contract_info['address']
+        else:
+            ticker = currency_id
+            contract_address = None
+        
+        currency_info[currency_id] = {
+            "currencyid": currency_id,
+            "ticker": ticker,
+            "mappedethaddress": contract_address
+        }
     
-    return {
-        "currencyid": currency_id,
-        "ticker": ticker,
-        "mappedethaddress": contract_address
-    }
+    return currency_info
@@ -8,23 +8,70 @@ Formula: Pair Liquidity = Total Converter Liquidity × (Weight of Currency A + W
 import json
 import logging
 from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
+import threading
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from verus_rpc import make_rpc_call
+from verus_rpc import make_rpc_call, make_rpc_batch
 from dict import get_ticker_by_id
 from block_height import get_session_block_height
 
 logger = logging.getLogger(__name__)
 
+# Bridge converter used to price each PBaaS chain's native currency in VRSC;
+# chains not listed here follow the standard Bridge.<chain> naming convention
+CHAIN_BRIDGE_NAMES = {
+    'CHIPS': 'Bridge.CHIPS',
+    'VARRR': 'Bridge.vARRR',
+    'VDEX': 'Bridge.vDEX'
+}
+
+# Prices keyed by (price key, session block height); only the current height is kept
+_session_price_cache = {}
+_session_price_cache_lock = threading.Lock()
+
+def _get_session_cached_price(price_key, fetch_price):
+    """
+    Return a price fetched at most once per session block height
+    
+    Args:
+        price_key: Cache key for the price (e.g. 'VRSC' or ('chain_to_vrsc', 'CHIPS'))
+        fetch_price: Function that fetches the price, returning 0.0 on failure
+        
+    Returns:
+        Cached or freshly fetched price (failures are not cached)
+    """
+    block_height = get_session_block_height()
+    if block_height is None:
+        return fetch_price()
+    
+    with _session_price_cache_lock:
+        price = _session_price_cache.get((price_key, block_height))
+    if price is not None:
+        return price
+    
+    price = fetch_price()
+    if price > 0:
+        with _session_price_cache_lock:
+            # Drop prices from older blocks before caching the new one
+            for key in [key for key in _session_price_cache if key[1] != block_height]:
+                del _session_price_cache[key]
+            _session_price_cache[(price_key, block_height)] = price
+    return price
+
 def get_vrsc_usd_price_cached():
     """
     Get VRSC to USD price using DAI estimation
     Uses session-based caching for consistency
     """
+    return _get_session_cached_price('VRSC', _fetch_vrsc_usd_price)
+
+def _fetch_vrsc_usd_price():
+    """Fetch VRSC to USD price using DAI estimation"""
     try:
         # Use estimateconversion to get VRSC to DAI.vETH rate via Bridge.vETH
         conversion_params = {'currency': 'VRSC', 'convertto': 'DAI.vETH', 'amount': 1, 'via': 'Bridge.vETH'}
@@ -44,7 +91,7 @@ def get_vrsc_usd_price_cached():
 def get_chain_to_vrsc_rate(chain: str) -> float:
     """
     Get conversion rate from any chain's native currency to VRSC via bridge
-    Standardized function for multi-chain support
+    Standardized function for multi-chain support, cached per session block height
     
     Args:
         chain: Chain name (CHIPS, VARRR, VDEX, etc.)
@@ -52,17 +99,13 @@ def get_chain_to_vrsc_rate(chain: str) -> float:
     Returns:
         Conversion rate (native currency to VRSC)
     """
+    return _get_session_cached_price(('chain_to_vrsc', chain), lambda: _fetch_chain_to_vrsc_rate(chain))
+
+def _fetch_chain_to_vrsc_rate(chain: str) -> float:
+    """Fetch conversion rate from a chain's native currency to VRSC via its bridge"""
     try:
         # Determine bridge name based on chain
-        if chain == 'CHIPS':
-            bridge_name = 'Bridge.CHIPS'
-        elif chain == 'VARRR':
-            bridge_name = 'Bridge.vARRR'
-        elif chain == 'VDEX':
-            bridge_name = 'Bridge.vDEX'
-        else:
-            # Standard naming convention for future chains
-            bridge_name = f'Bridge.{chain}'
+        bridge_name = CHAIN_BRIDGE_NAMES.get(chain) or f'Bridge.{chain}'
         
         # Get native currency to VRSC conversion via bridge
         conversion_params = {'currency': chain, 'convertto': 'VRSC', 'amount': 1, 'via': bridge_name}
@@ -70,7 +113,7 @@ def get_chain_to_vrsc_rate(chain: str) -> float:
         
         if conversion_result and 'estimatedcurrencyout' in conversion_result:
             rate = float(conversion_result['estimatedcurrencyout'])
-            logger.info(f"Got {chain}→VRSC rate via {bridge_name}: {rate}")
+            logger.info("Got %s→VRSC rate via %s: %s", chain, bridge_name, rate)
             return rate
         else:
             logger.error(f"Failed to get {chain}→VRSC conversion via {bridge_name}")
@@ -106,7 +149,7 @@ def get_chain_usd_price(chain: str) -> float:
         
         # Step 3: Calculate chain USD price
         chain_usd_price = chain_to_vrsc_rate * vrsc_usd_price
-        logger.info(f"Calculated {chain} USD price: {chain_usd_price} (rate: {chain_to_vrsc_rate} × VRSC: {vrsc_usd_price})")
+        logger.info("Calculated %s USD price: %s (rate: %s × VRSC: %s)", chain, chain_usd_price, chain_to_vrsc_rate, vrsc_usd_price)
         
         return chain_usd_price
         
@@ -114,7 +157,71 @@ def get_chain_usd_price(chain: str) -> float:
         logger.error(f"Error calculating {chain} USD price: {e}")
         return 0.0
 
-def get_converter_liquidity(converter_name: str, converters_data: Dict, min_liquidity_threshold: float = 1000.0) -> float:
+def index_converters_by_name(converters_data) -> Dict[str, Dict]:
+    """
+    Index converter discovery data by converter name (first entry wins, like a linear search)
+    
+    Args:
+        converters_data: Converter discovery data
+        
+    Returns:
+        Dict of converter name -> converter info
+    """
+    converters_index = {}
+    for conv in converters_data:
+        converters_index.setdefault(conv.get('name'), conv)
+    return converters_index
+
+def get_converter_native_ratios(converter_names, converters_data: Dict,
+                                converters_index: Optional[Dict] = None) -> Dict[str, float]:
+    """
+    Get the converter to native chain currency ratio for many converters, using one
+    batched estimateconversion request per chain (chains are queried concurrently)
+    
+    Args:
+        converter_names: Names of the converters to price
+        converters_data: Converter discovery data
+        converters_index: Prebuilt index_converters_by_name() result for converters_data
+        
+    Returns:
+        Dict of converter name -> native ratio (0.0 if the estimate failed)
+    """
+    if converters_index is None:
+        converters_index = index_converters_by_name(converters_data)
+    
+    # Every converter is priced in its own chain's native currency on that chain
+    chain_calls = {}
+    for converter_name in converter_names:
+        converter_info = converters_index.get(converter_name)
+        if not converter_info or not converter_info.get('currency_id'):
+            continue
+        source_chain = converter_info.get('source_chain', 'VRSC')
+        conversion_params = {'currency': converter_info['currency_id'], 'convertto': source_chain, 'amount': 1}
+        chain_calls.setdefault(source_chain, []).append((converter_name, conversion_params))
+    
+    def fetch_chain_ratios(source_chain, calls):
+        results = make_rpc_batch(source_chain, [('estimateconversion', [params]) for _, params in calls])
+        chain_ratios = {}
+        for (converter_name, _), conversion_result in zip(calls, results):
+            try:
+                if conversion_result and 'estimatedcurrencyout' in conversion_result:
+                    chain_ratios[converter_name] = float(conversion_result['estimatedcurrencyout'])
+                else:
+                    chain_ratios[converter_name] = 0.0
+            except Exception as e:
+                logger.error(f"Error getting {converter_name} to {source_chain} conversion: {e}")
+                chain_ratios[converter_name] = 0.0
+        return chain_ratios
+    
+    native_ratios = {}
+    with ThreadPoolExecutor(max_workers=max(len(chain_calls), 1)) as executor:
+        for chain_ratios in executor.map(fetch_chain_ratios, chain_calls.keys(), chain_calls.values()):
+            native_ratios.update(chain_ratios)
+    
+    return native_ratios
+
+def get_converter_liquidity(converter_name: str, converters_data: Dict, min_liquidity_threshold: float = 1000.0,
+                            native_ratio: Optional[float] = None, converters_index: Optional[Dict] = None) -> float:
     """
     Calculate total liquidity for a converter in USD
     Based on proven working code from Deploy/batch_api_v2.py with multi-chain support
@@ -123,17 +230,17 @@ def get_converter_liquidity(converter_name: str, converters_data: Dict, min_liqu
         converter_name: Name of the converter
         converters_data: Converter discovery data
         min_liquidity_threshold: Minimum liquidity threshold in native currency (default: 1000)
+        native_ratio: Prefetched converter to native currency ratio from get_converter_native_ratios()
+        converters_index: Prebuilt index_converters_by_name() result for converters_data
         
     Returns:
         Total liquidity in USD (0 if below threshold)
     """
     try:
         # Find the converter in the data
-        converter_info = None
-        for conv in converters_data:
-            if conv.get('name') == converter_name:
-                converter_info = conv
-                break
+        if converters_index is None:
+            converters_index = index_converters_by_name(converters_data)
+        converter_info = converters_index.get(converter_name)
         
         if not converter_info:
             logger.error(f"Converter {converter_name} not found in data")
@@ -148,45 +255,48 @@ def get_converter_liquidity(converter_name: str, converters_data: Dict, min_liqu
         
         # Step 1: Get converter to native chain currency conversion ratio
         source_chain = converter_info.get('source_chain', 'VRSC')
-        native_ratio = 0
         
-        # Special handling for Bridge converters on VARRR and VDEX chains
-        if source_chain in ['VARRR', 'VDEX'] and converter_name.startswith('Bridge.'):
-            # Use proper converter-to-native-chain conversion method
-            native_currency = source_chain  # vARRR or vDEX
-            try:
-                conversion_params = {'currency': converter_id, 'convertto': native_currency, 'amount': 1}
-                conversion_result = make_rpc_call(source_chain, 'estimateconversion', [conversion_params])
+        # Skip the RPC when the caller already fetched the ratio in a batch
+        if native_ratio is None:
+            native_ratio = 0
+            
+            # Special handling for Bridge converters on VARRR and VDEX chains
+            if source_chain in ['VARRR', 'VDEX'] and converter_name.startswith('Bridge.'):
+                # Use proper converter-to-native-chain conversion method
+                native_currency = source_chain  # vARRR or vDEX
+                try:
+                    conversion_params = {'currency': converter_id, 'convertto': native_currency, 'amount': 1}
+                    conversion_result = make_rpc_call(source_chain, 'estimateconversion', [conversion_params])
                 
-                if conversion_result and 'estimatedcurrencyout' in conversion_result:
-                    native_ratio = float(conversion_result['estimatedcurrencyout'])
-                    logger.info(f"Got {converter_name} to {native_currency} ratio: {native_ratio}")
-            except Exception as e:
-                logger.error(f"Error getting {converter_name} to {native_currency} conversion: {e}")
-        
-        elif source_chain == 'VRSC':
-            # VRSC converters - convert to VRSC
-            try:
-                conversion_params = {'currency': converter_id, 'convertto': 'VRSC', 'amount': 1}
-                conversion_result = make_rpc_call('VRSC', 'estimateconversion', [conversion_params])
+                    if conversion_result and 'estimatedcurrencyout' in conversion_result:
+                        native_ratio = float(conversion_result['estimatedcurrencyout'])
+                        logger.info("Got %s to %s ratio: %s", converter_name, native_currency, native_ratio)
+                except Exception as e:
+                    logger.error(f"Error getting {converter_name} to {native_currency} conversion: {e}")
+        
+            elif source_chain == 'VRSC':
+                # VRSC converters - convert to VRSC
+                try:
+                    conversion_params = {'currency': converter_id, 'convertto': 'VRSC', 'amount': 1}
+                    conversion_result = make_rpc_call('VRSC', 'estimateconversion', [conversion_params])
                 
-                if conversion_result and 'estimatedcurrencyout' in conversion_result:
-                    native_ratio = float(conversion_result['estimatedcurrencyout'])
-            except Exception as e:
-                logger.error(f"Error getting {converter_name} to VRSC conversion: {e}")
-        else:
-            # Other chains - native converters
-            # Get converter-to-native-chain ratio (e.g., Highroller.CHIPS -> CHIPS)
-            native_currency = source_chain  # CHIPS, VARRR, VDEX
-            try:
-                conversion_params = {'currency': converter_id, 'convertto': native_currency, 'amount': 1}
-                conversion_result = make_rpc_call(source_chain, 'estimateconversion', [conversion_params])
+                    if conversion_result and 'estimatedcurrencyout' in conversion_result:
+                        native_ratio = float(conversion_result['estimatedcurrencyout'])
+                except Exception as e:
+                    logger.error(f"Error getting {converter_name} to VRSC conversion: {e}")
+            else:
+                # Other chains - native converters
+                # Get converter-to-native-chain ratio (e.g., Highroller.CHIPS -> CHIPS)
+                native_currency = source_chain  # CHIPS, VARRR, VDEX
+                try:
+                    conversion_params = {'currency': converter_id, 'convertto': native_currency, 'amount': 1}
+                    conversion_result = make_rpc_call(source_chain, 'estimateconversion', [conversion_params])
                 
-                if conversion_result and 'estimatedcurrencyout' in conversion_result:
-                    native_ratio = float(conversion_result['estimatedcurrencyout'])
-                    logger.info(f"Got {converter_name} to {native_currency} ratio: {native_ratio}")
-            except Exception as e:
-                logger.error(f"Error getting {converter_name} to {native_currency} conversion: {e}")
+                    if conversion_result and 'estimatedcurrencyout' in conversion_result:
+                        native_ratio = float(conversion_result['estimatedcurrencyout'])
+                        logger.info("Got %s to %s ratio: %s", converter_name, native_currency, native_ratio)
+                except Exception as e:
+                    logger.error(f"Error getting {converter_name} to {native_currency} conversion: {e}")
         
         if native_ratio <= 0:
             logger.error(f"Could not get valid native currency ratio for {converter_name}")
@@ -209,14 +319,14 @@ def get_converter_liquidity(converter_name: str, converters_data: Dict, min_liqu
         
         # Apply minimum liquidity threshold
         if supply < min_liquidity_threshold:
-            logger.info(f"Converter {converter_name} below threshold: {supply} < {min_liquidity_threshold}")
+            logger.info("Converter %s below threshold: %s < %s", converter_name, supply, min_liquidity_threshold)
             return 0.0
         
-        logger.info(f"Liquidity calculation for {converter_name} (Chain: {source_chain}):")
-        logger.info(f"  Supply: {supply}")
-        logger.info(f"  Native ratio: {native_ratio}")
-        logger.info(f"  Native USD price: {native_usd_price}")
-        logger.info(f"  Total liquidity: ${total_liquidity:.2f}")
+        logger.info("Liquidity calculation for %s (Chain: %s):", converter_name, source_chain)
+        logger.info("  Supply: %s", supply)
+        logger.info("  Native ratio: %s", native_ratio)
+        logger.info("  Native USD price: %s", native_usd_price)
+        logger.info("  Total liquidity: $%.2f", total_liquidity)
         
         return total_liquidity
         
@@ -224,7 +334,103 @@ def get_converter_liquidity(converter_name: str, converters_data: Dict, min_liqu
         logger.error(f"Error calculating converter liquidity for {converter_name}: {e}")
         return 0.0
 
-def get_pair_liquidity(converter_name: str, base_currency: str, target_currency: str, converters_data: Dict) -> float:
+def _get_reserve_weights(converter_info: Dict):
+    """
+    Get reserve currency weights for a converter
+    
+    Returns:
+        tuple: (ticker -> weight dict, total weight of all reserves)
+    """
+    ticker_weights = {}
+    total_weight = 0
+    for rc in converter_info.get('reserve_currencies', []):
+        weight = float(rc.get('weight', 0))
+        total_weight += weight
+        ticker_weights[rc.get('ticker', '')] = weight
+    return ticker_weights, total_weight
+
+def _calculate_pair_liquidity(converter_name: str, base_currency: str, target_currency: str,
+                              base_weight: float, target_weight: float, total_weight: float,
+                              total_liquidity: float) -> float:
+    """Apply the pair liquidity formula to a pair's reserve weights"""
+    # Check if this is a special case (converter currency is one of the pair currencies)
+    base_is_converter = (base_currency == converter_name)
+    target_is_converter = (target_currency == converter_name)
+    is_special_case = base_is_converter or target_is_converter
+    
+    if is_special_case:
+        # Special case: one currency is the converter itself
+        # Find the weight of the non-converter currency
+        non_converter_weight = target_weight if base_is_converter else base_weight
+        
+        if non_converter_weight > 0 and total_weight > 0:
+            # Formula: (weight * total_liquidity) * 2
+            weight_fraction = non_converter_weight / total_weight
+            pair_liquidity = (weight_fraction * total_liquidity) * 2
+            return pair_liquidity
+        else:
+            return 0.0
+    else:
+        # Regular case: both currencies are reserve currencies
+        if base_weight > 0 and target_weight > 0 and total_weight > 0:
+            # Formula: (weight1 + weight2) / total_weight * total_liquidity
+            combined_weight_fraction = (base_weight + target_weight) / total_weight
+            pair_liquidity = combined_weight_fraction * total_liquidity
+            return pair_liquidity
+        else:
+            return 0.0
+
+def compute_all_pair_liquidity(converter_name: str, converters_data: Dict, native_ratio: Optional[float] = None,
+                               converters_index: Optional[Dict] = None) -> Dict:
+    """
+    Calculate the liquidity of every pair in a converter, computing the total
+    converter liquidity only once (same formula as get_pair_liquidity)
+    
+    Args:
+        converter_name: Name of the converter
+        converters_data: Converter discovery data
+        native_ratio: Prefetched converter to native currency ratio from get_converter_native_ratios()
+        converters_index: Prebuilt index_converters_by_name() result for converters_data
+        
+    Returns:
+        Dict of (base_currency, target_currency) -> pair liquidity in USD, for every ordered
+        pair of the converter currency and its reserve tickers (empty if not computable)
+    """
+    try:
+        if converters_index is None:
+            converters_index = index_converters_by_name(converters_data)
+        
+        total_liquidity = get_converter_liquidity(
+            converter_name, converters_data, native_ratio=native_ratio, converters_index=converters_index
+        )
+        if total_liquidity <= 0:
+            return {}
+        
+        converter_info = converters_index.get(converter_name)
+        if not converter_info:
+            logger.error(f"Converter {converter_name} not found in data")
+            return {}
+        
+        ticker_weights, total_weight = _get_reserve_weights(converter_info)
+        symbols = [converter_name] + [rc['ticker'] for rc in converter_info.get('reserve_currencies', []) if 'ticker' in rc]
+        
+        pair_liquidity = {}
+        for base_currency in symbols:
+            for target_currency in symbols:
+                if base_currency != target_currency:
+                    pair_liquidity[(base_currency, target_currency)] = _calculate_pair_liquidity(
+                        converter_name, base_currency, target_currency,
+                        ticker_weights.get(base_currency, 0), ticker_weights.get(target_currency, 0),
+                        total_weight, total_liquidity
+                    )
+        return pair_liquidity
+        
+    except Exception as e:
+        logger.error(f"Error calculating pair liquidity for {converter_name}: {e}")
+        return {}
+
+def get_pair_liquidity(converter_name: str, base_currency: str, target_currency: str, converters_data: Dict,
+                       total_liquidity: Optional[float] = None, converters_index: Optional[Dict] = None) -> float:
     """
     Calculate the liquidity for a specific trading pair in a converter
     Formula: (weight1 + weight2) / total_weight * total_liquidity
@@ -235,72 +441,38 @@ def get_pair_liquidity(converter_name: str, base_currency: str, target_currency:
         base_currency: Base currency of the pair
         target_currency: Target currency of the pair
         converters_data: Converter discovery data
+        total_liquidity: Precomputed get_converter_liquidity() result, to skip recalculating it
+        converters_index: Prebuilt index_converters_by_name() result for converters_data
         
     Returns:
         Pair liquidity in USD
     """
     try:
         # Get total converter liquidity first
-        total_liquidity = get_converter_liquidity(converter_name, converters_data)
+        if converters_index is None:
+            converters_index = index_converters_by_name(converters_data)
+        if total_liquidity is None:
+            total_liquidity = get_converter_liquidity(converter_name, converters_data, converters_index=converters_index)
         
         if total_liquidity <= 0:
             return 0.0
         
         # Find the converter in the data
-        converter_info = None
-        for conv in converters_data:
-            if conv.get('name') == converter_name:
-                converter_info = conv
-                break
+        converter_info = converters_index.get(converter_name)
         
         if not converter_info:
             logger.error(f"Converter {converter_name} not found in data")
             return 0.0
         
         # Get weights for the currencies
-        base_weight = 0
-        target_weight = 0
-        total_weight = 0
-        
-        reserve_currencies = converter_info.get('reserve_currencies', [])
-        for rc in reserve_currencies:
-            weight = float(rc.get('weight', 0))
-            total_weight += weight
-            
-            currency_ticker = rc.get('ticker', '')
-            
-            if currency_ticker == base_currency:
-                base_weight = weight
-            if currency_ticker == target_currency:
-                target_weight = weight
-        
-        # Check if this is a special case (converter currency is one of the pair currencies)
-        base_is_converter = (base_currency == converter_name)
-        target_is_converter = (target_currency == converter_name)
-        is_special_case = base_is_converter or target_is_converter
-        
-        if is_special_case:
-            # Special case: one currency is the converter itself
-            # Find the weight of the non-converter currency
-            non_converter_weight = target_weight if base_is_converter else base_weight
-            
-            if non_converter_weight > 0 and total_weight > 0:
-                # Formula: (weight * total_liquidity) * 2
-                weight_fraction = non_converter_weight / total_weight
-                pair_liquidity = (weight_fraction * total_liquidity) * 2
-                return pair_liquidity
-            else:
-                return 0.0
-        else:
-            # Regular case: both currencies are reserve currencies
-            if base_weight > 0 and target_weight > 0 and total_weight > 0:
-                # Formula: (weight1 + weight2) / total_weight * total_liquidity
-                combined_weight_fraction = (base_weight + target_weight) / total_weight
-                pair_liquidity = combined_weight_fraction * total_liquidity
-                return pair_liquidity
-            else:
-                return 0.0
-                
+        ticker_weights, total_weight = _get_reserve_weights(converter_info)
+        
+        return _calculate_pair_liquidity(
+            converter_name, base_currency, target_currency,
+            ticker_weights.get(base_currency, 0), ticker_weights.get(target_currency, 0),
+            total_weight, total_liquidity
+        )
+        
     except Exception as e:
         logger.error(f"Error calculating pair liquidity for {base_currency}-{target_currency} in {converter_name}: {e}")
         return 0.0
@@ -6,10 +6,11 @@ Core FastAPI skeleton with basic structure and health checks
 
 import os
 import logging
-from datetime import datetime
-from fastapi import FastAPI, HTTPException, Query
+import hashlib
+from datetime import datetime, timezone
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import Response
 from verussupply import get_vrsc_supply
 from dotenv import load_dotenv
@@ -17,15 +18,15 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException, Request
-from uvicorn import run
 import uvicorn
 import sys
-import json
+import orjson
 from typing import Dict, Any
 import subprocess
 import signal
 import time
+import asyncio
+from contextvars import ContextVar
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -41,64 +42,229 @@ logger = logging.getLogger(__name__)
 ENABLE_LIVE_ENDPOINTS = os.getenv('ENABLE_LIVE_ENDPOINTS', 'false').lower() == 'true'
 logger.info(f"Live endpoints enabled: {ENABLE_LIVE_ENDPOINTS}")
 
+# Per-request uvicorn access logging (off by default for production)
+ACCESS_LOG = os.getenv('ACCESS_LOG', 'false').lower() == 'true'
+
+# Configure JSON formatting: compact for API clients, indented for humans with ?pretty=1
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse as BaseJSONResponse
+
+_pretty_json_requested = ContextVar('pretty_json_requested', default=False)
+
+def pretty_json_dumps(content) -> bytes:
+    """Serialize to UTF-8 JSON with orjson (indented when the request asked for ?pretty=1), falling back to jsonable_encoder for other types"""
+    option = orjson.OPT_NON_STR_KEYS
+    if _pretty_json_requested.get():
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(
+        content,
+        default=jsonable_encoder,
+        option=option
+    )
+
+class PrettyJSONResponse(BaseJSONResponse):
+    def render(self, content) -> bytes:
+        return pretty_json_dumps(content)
+
 # Create FastAPI app with pretty JSON formatting
 app = FastAPI(
     title="Verus Ticker API",
     description="Real-time cryptocurrency ticker data from Verus blockchain",
     version="1.0.0",
     docs_url=None,
-    redoc_url=None
+    redoc_url=None,
+    default_response_class=PrettyJSONResponse
 )
 
-# Configure JSON formatting for human readability
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse as BaseJSONResponse
+# CORS for a public, read-only API: every origin is allowed and no credentials are used,
+# so the headers are static and can be attached without per-request origin matching
+CORS_RESPONSE_HEADERS = [(b"access-control-allow-origin", b"*")]
+CORS_PREFLIGHT_HEADERS = CORS_RESPONSE_HEADERS + [
+    (b"access-control-allow-methods", b"GET, POST, PUT, DELETE"),
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"0"),
+]
 
-class PrettyJSONResponse(BaseJSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            jsonable_encoder(content),
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=2,
-            separators=(',', ': ')
-        ).encode('utf-8')
+class PublicCORSMiddleware:
+    """ASGI middleware adding static CORS headers and answering preflight requests"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS" and any(name == b"access-control-request-method" for name, _ in scope["headers"]):
+            await send({"type": "http.response.start", "status": 204, "headers": list(CORS_PREFLIGHT_HEADERS)})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + CORS_RESPONSE_HEADERS
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
 
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["*"],
-)
+app.add_middleware(PublicCORSMiddleware)
+
+# Successful cached ticker responses get an ETag and a Cache-Control matching the 60s cache TTL,
+# so clients can revalidate with If-None-Match and receive an empty 304. /coinpaprika is left out:
+# its body carries a per-request timestamp, so its ETag would never match
+CACHED_ENDPOINT_MAX_AGE = 60
+
+def compute_etag(body: bytes) -> str:
+    """Weak ETag for a response body; GZipMiddleware may re-encode the bytes on the way out"""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def _opaque_etag(etag: str) -> str:
+    """ETag without its weak W/ prefix"""
+    return etag[2:] if etag.startswith("W/") else etag
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header covers the given ETag (weak comparison)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    opaque_tag = _opaque_etag(etag)
+    return any(_opaque_etag(tag.strip()) in (opaque_tag, "*") for tag in if_none_match.split(","))
+
+def cached_ticker_response(request: Request, body: bytes) -> Response:
+    """
+    Build the success response for a cached ticker endpoint, answering 304 when the client's copy is current
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        body: Encoded JSON ticker data
+        
+    Returns:
+        Response: 200 with the body and cache headers, or an empty 304
+    """
+    cache_headers = {"ETag": compute_etag(body), "Cache-Control": f"public, max-age={CACHED_ENDPOINT_MAX_AGE}"}
+    if etag_matches(request, cache_headers["ETag"]):
+        return Response(status_code=304, headers=cache_headers)
+    
+    cache_headers["Content-Type"] = "application/json; charset=utf-8"
+    return Response(content=body, media_type="application/json", headers=cache_headers)
+
+# Compress larger responses (ticker JSON, root HTML) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Pretty-print JSON responses only when requested
+@app.middleware("http")
+async def pretty_json_query_param(request: Request, call_next):
+    token = _pretty_json_requested.set(request.query_params.get("pretty", "").lower() in ("1", "true"))
+    try:
+        return await call_next(request)
+    finally:
+        _pretty_json_requested.reset(token)
+
+# UTC ISO timestamp for /health and error bodies, recomputed at most once per second
+_utc_timestamp = (0, "")
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string at one-second resolution"""
+    global _utc_timestamp
+    
+    now = int(time.time())
+    cached_second, cached_timestamp = _utc_timestamp
+    if now != cached_second:
+        cached_timestamp = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+        _utc_timestamp = (now, cached_timestamp)
+    return cached_timestamp
+
+# Global exception handler; the error body is static apart from the timestamp
+INTERNAL_ERROR_BODY_PREFIX = b'{"error":"Internal server error","message":"An unexpected error occurred","timestamp":"'
 
-# Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"Global exception on {request.url}: {str(exc)}")
-    return JSONResponse(
+    return Response(
+        content=INTERNAL_ERROR_BODY_PREFIX + utc_timestamp().encode() + b'"}',
         status_code=500,
-        content={
-            "error": "Internal server error",
-            "message": "An unexpected error occurred",
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        media_type="application/json"
     )
 
-# Import and register VRSC supply endpoint
-from verussupply import get_vrsc_supply
-
+# Register VRSC supply endpoint
 @app.get("/verussupply")
 async def verussupply_endpoint():
     """Get VRSC supply information including total supply, VRSC in converters, and circulating supply"""
-    return await get_vrsc_supply()
+    return PrettyJSONResponse(content=await get_vrsc_supply())
+
+# Favicon endpoint to prevent 404 errors; browsers may cache the empty icon for a year
+FAVICON_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
 
-# Favicon endpoint to prevent 404 errors
 @app.get("/favicon.ico")
 async def favicon():
     """Return empty response for favicon to prevent 404 errors"""
-    return Response(content="", media_type="image/x-icon")
+    # A fresh Response per call: ASGI middleware may modify a response's header list in place
+    return Response(status_code=204, headers=FAVICON_HEADERS)
+
+# Health check dependencies, imported once here rather than per request
+# (after logging is configured above, since cache_manager calls basicConfig on import)
+from cache_manager import get_cache_status
+from verus_rpc import make_rpc_call
+
+# Seconds a /health RPC probe result is reused, so frequent health pings don't each hit getinfo
+HEALTH_RPC_CACHE_TTL = 2.0
+_health_rpc_cache = {"checked_at": 0.0, "rpc_status": None, "current_block": 0}
+
+# Static parts of the /health response
+HEALTH_ENDPOINTS = {
+    "cached": [
+        "/coingecko",
+        "/coinmarketcap",
+        "/coinpaprika",
+        "/coinmarketcap_iaddress"
+    ],
+    "non_cached": [
+        "/coingecko_live",
+        "/coinmarketcap_live",
+        "/coinpaprika_live",
+        "/coinmarketcap_iaddress_live"
+    ],
+    "utility": [
+        "/verussupply"
+    ]
+}
+HEALTH_PERFORMANCE_BENEFITS = {
+    "cached_response_time": "<0.1s (typical)",
+    "non_cached_response_time": "0.5-1.0s (typical)",
+    "rpc_calls_saved": "60-80 calls per cached request"
+}
+HEALTH_STATIC_FIELDS = {
+    "version": "1.0.0",
+    "endpoints": HEALTH_ENDPOINTS,
+    "performance_benefits": HEALTH_PERFORMANCE_BENEFITS
+}
+
+def _probe_rpc_status():
+    """
+    Test the VRSC RPC connection for /health, reusing a probe younger than HEALTH_RPC_CACHE_TTL
+    
+    Returns:
+        tuple: (rpc_status, current_block)
+    """
+    now = time.monotonic()
+    if _health_rpc_cache["rpc_status"] is not None and now - _health_rpc_cache["checked_at"] < HEALTH_RPC_CACHE_TTL:
+        return _health_rpc_cache["rpc_status"], _health_rpc_cache["current_block"]
+    
+    rpc_status = "ok"
+    current_block = 0
+    try:
+        result = make_rpc_call("VRSC", "getinfo", [])
+        if result and 'blocks' in result:
+            current_block = result.get('blocks', 0)
+        else:
+            rpc_status = "failed"
+    except Exception as rpc_e:
+        rpc_status = f"error: {str(rpc_e)}"
+    _health_rpc_cache.update(checked_at=now, rpc_status=rpc_status, current_block=current_block)
+    return rpc_status, current_block
 
 # Combined health check and cache status endpoint
 @app.get("/health")
@@ -110,59 +276,24 @@ async def health_and_cache_status():
         Server health, RPC connection status, cache information, and performance metrics
     """
     try:
-        from fastapi.responses import Response
-        from cache_manager import get_cache_status
-        from verus_rpc import make_rpc_call
-        import json
-        
-        # Test RPC connection
-        rpc_status = "ok"
-        current_block = 0
-        try:
-            result = make_rpc_call("VRSC", "getinfo", [])
-            if result and 'blocks' in result:
-                current_block = result.get('blocks', 0)
-            else:
-                rpc_status = "failed"
-        except Exception as rpc_e:
-            rpc_status = f"error: {str(rpc_e)}"
-        
-        # Get cache information
-        cache_info = get_cache_status()
+        # Test RPC connection and get cache information concurrently, off the event loop
+        # (getinfo is a blocking HTTP call and the cache lock may be held by a refresh)
+        (rpc_status, current_block), cache_info = await asyncio.gather(
+            asyncio.to_thread(_probe_rpc_status),
+            asyncio.to_thread(get_cache_status)
+        )
         
         # Prepare comprehensive response
         response_data = {
             "status": "healthy" if rpc_status == "ok" else "degraded",
             "rpc_connection": rpc_status,
             "current_block": current_block,
-            "version": "1.0.0",
             "cache_status": cache_info,
-            "endpoints": {
-                "cached": [
-                    "/coingecko",
-                    "/coinmarketcap",
-                    "/coinpaprika",
-                    "/coinmarketcap_iaddress"
-                ],
-                "non_cached": [
-                    "/coingecko_live",
-                    "/coinmarketcap_live",
-                    "/coinpaprika_live",
-                    "/coinmarketcap_iaddress_live"
-                ],
-                "utility": [
-                    "/verussupply"
-                ]
-            },
-            "performance_benefits": {
-                "cached_response_time": "<0.1s (typical)",
-                "non_cached_response_time": "0.5-1.0s (typical)",
-                "rpc_calls_saved": "60-80 calls per cached request"
-            },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_timestamp(),
+            **HEALTH_STATIC_FIELDS
         }
         
-        pretty_json = json.dumps(response_data, indent=2, ensure_ascii=False)
+        pretty_json = pretty_json_dumps(response_data)
         
         return Response(
             content=pretty_json,
@@ -172,7 +303,7 @@ async def health_and_cache_status():
         
     except Exception as e:
         logger.error(f"❌ Error in health endpoint: {e}")
-        error_json = json.dumps({"error": str(e), "status": "unhealthy"}, indent=2)
+        error_json = pretty_json_dumps({"error": str(e), "status": "unhealthy"})
         return Response(
             content=error_json,
             media_type="application/json",
@@ -180,9 +311,7 @@ async def health_and_cache_status():
             status_code=503
         )
 
-# Root endpoint
-@app.get("/", response_class=HTMLResponse)
-async def root():
+def _root_html_content():
     """Clean and Simple VRSC/vETH Trace Process Documentation"""
     html_content = """
     <!DOCTYPE html>
@@ -663,8 +792,8 @@ async def root():
             <div class="tech-detail">
                 <h4>Step 1: Converter Discovery and Filtering</h4>
                 <p><strong>Method:</strong> Call <code>getcurrencyconverters("VRSC")</code> RPC method to get all converters in the VRSC system</p>
-                <p><strong>Filtering:</strong> Exclude converters listed in <code>excluded_chains</code> array: <code>["Bridge.CHIPS", "Bridge.vDEX", "Bridge.vARRR", "whales"]</code></p>
-                <p><strong>Validation:</strong> Check each converter has <code>fullyqualifiedname</code> field and is not in exclusion list</p>
+                <p><strong>Filtering:</strong> Bridge converters are kept only on the chain that hosts them (<code>BRIDGE_CONVERTER_CHAINS</code>), and converters holding less than the chain's <code>MIN_NATIVE_TOKENS</code> in native reserves are excluded</p>
+                <p><strong>Validation:</strong> Check each converter has <code>fullyqualifiedname</code> field</p>
                 <p><strong>Result:</strong> List of active converters that contain VRSC as a reserve currency</p>
                 <p><strong>Current Count:</strong> 9 active converters (Bridge.vETH, Switch, Kaiju, vYIELD, SUPER🛒, NATI🦉, Pure, SUPERVRSC, NATI)</p>
             </div>
@@ -921,7 +1050,7 @@ CHIPS_MIN_NATIVE_TOKENS=20000</div>
             <div class="tech-detail">
                 <h4>🚫 Exclusion and Filtering Logic</h4>
                 <p><strong>Converter Currency Exclusion:</strong> <code>is_converter_currency()</code> removes basket currencies from trading pairs</p>
-                <p><strong>Chain Exclusion:</strong> <code>excluded_chains</code> filters out problematic converters (Bridge.CHIPS, Bridge.vDEX, etc.)</p>
+                <p><strong>Bridge Deduplication:</strong> <code>BRIDGE_CONVERTER_CHAINS</code> counts each bridge converter (Bridge.CHIPS, Bridge.vDEX, etc.) only on its hosting chain</p>
                 <p><strong>Volume Filtering:</strong> Only pairs with base_volume > 0 OR target_volume > 0 are included</p>
                 <p><strong>Contract Validation:</strong> Pairs without valid contract addresses use fallback symbol mapping</p>
             </div>
@@ -974,11 +1103,35 @@ CHIPS_MIN_NATIVE_TOKENS=20000</div>
     </body>
     </html>
     """
-    return HTMLResponse(content=html_content)
+    return html_content
+
+# The root page is static; encode it and compute its ETag once at import
+ROOT_HTML_BYTES = _root_html_content().encode('utf-8')
+ROOT_HTML_HEADERS = {"ETag": compute_etag(ROOT_HTML_BYTES), "Cache-Control": "public, max-age=300"}
+
+# Root endpoint
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    """Clean and Simple VRSC/vETH Trace Process Documentation"""
+    if etag_matches(request, ROOT_HTML_HEADERS["ETag"]):
+        return Response(status_code=304, headers=ROOT_HTML_HEADERS)
+    return HTMLResponse(content=ROOT_HTML_BYTES, headers=ROOT_HTML_HEADERS)
 
 # API v1 router placeholder (unused endpoint removed)
 
 # Multi-chain converter discovery endpoint
+from converter_discovery import discover_active_converters
+from block_height import session_scope
+
+# Chains /converters can discover, in discovery order
+CONVERTER_CHAINS = ["VRSC", "CHIPS", "VARRR", "VDEX"]
+CONVERTER_CHAINS_SET = frozenset(CONVERTER_CHAINS)
+
+def _discover_converters_in_session(chains):
+    """Run converter discovery in its own session (blocking; called off the event loop)"""
+    with session_scope():
+        return discover_active_converters(chains=chains)
+
 @app.get("/converters")
 async def get_converters(chain: str = None):
     """
@@ -988,48 +1141,38 @@ async def get_converters(chain: str = None):
         chain: Optional chain filter (VRSC, CHIPS, VARRR, VDEX). If not specified, returns all chains.
     """
     try:
-        from converter_discovery import discover_active_converters
-        from block_height import start_new_session, clear_session
-        
-        logger.info(f"Processing converter discovery request for chain: {chain or 'all chains'}")
-        
-        # Start new session for consistency
-        session_id = start_new_session()
-        
-        try:
-            # Determine which chains to discover
-            if chain:
-                # Validate chain parameter
-                valid_chains = ["VRSC", "CHIPS", "VARRR", "VDEX"]
-                if chain.upper() not in valid_chains:
-                    return PrettyJSONResponse(
-                        content={"error": f"Invalid chain '{chain}'. Valid chains: {valid_chains}"},
-                        status_code=400
-                    )
-                chains = [chain.upper()]
-            else:
-                # Discover all chains
-                chains = ["VRSC", "CHIPS", "VARRR", "VDEX"]
-            
-            # Discover converters
-            result = discover_active_converters(chains=chains)
-            
-            if 'error' in result:
-                logger.error(f"Converter discovery failed: {result['error']}")
+        logger.info("Processing converter discovery request for chain: %s", chain or 'all chains')
+        
+        # Determine which chains to discover
+        if chain:
+            # Validate chain parameter
+            chain_upper = chain.upper()
+            if chain_upper not in CONVERTER_CHAINS_SET:
                 return PrettyJSONResponse(
-                    content={"error": result['error']},
-                    status_code=503
+                    content={"error": f"Invalid chain '{chain}'. Valid chains: {CONVERTER_CHAINS}"},
+                    status_code=400
                 )
-            
-            logger.info(f"Successfully discovered {result['active_count']} converters across {len(chains)} chains")
-            return PrettyJSONResponse(content=result)
-            
-        finally:
-            # Clean up session
-            clear_session()
+            chains = [chain_upper]
+        else:
+            # Discover all chains
+            chains = list(CONVERTER_CHAINS)
+        
+        # Discover converters (blocking RPC work, run off the event loop); the worker thread
+        # owns the session from start to clear, so overlapping requests cannot touch it
+        result = await asyncio.to_thread(_discover_converters_in_session, chains)
+        
+        if 'error' in result:
+            logger.error("Converter discovery failed: %s", result['error'])
+            return PrettyJSONResponse(
+                content={"error": result['error']},
+                status_code=503
+            )
+        
+        logger.info("Successfully discovered %s converters across %d chains", result['active_count'], len(chains))
+        return PrettyJSONResponse(content=result)
         
     except Exception as e:
-        logger.error(f"Error in converter discovery endpoint: {str(e)}")
+        logger.error("Error in converter discovery endpoint: %s", e)
         return PrettyJSONResponse(
             content={"error": f"Internal server error: {str(e)}"},
             status_code=500
@@ -1041,169 +1184,189 @@ async def get_converters(chain: str = None):
 # These endpoints make fresh RPC calls and are slower but more accurate.
 # Use cached endpoints for production. Enable these only for testing/debugging.
 
+# Gated once at import: exactly one set of /*_live routes is registered
 if ENABLE_LIVE_ENDPOINTS:
     logger.info("🔴 Live endpoints are ENABLED - these make fresh RPC calls")
-else:
-    logger.info("✅ Live endpoints are DISABLED - use cached endpoints for production")
-
-if ENABLE_LIVE_ENDPOINTS:
-    # Live endpoints implementation
-    @app.get("/coingecko_live")
-    async def get_coingecko_live():
-        """Live CoinGecko endpoint - makes fresh RPC calls"""
-        try:
-            from data_integration import extract_all_pairs_data
-            from ticker_formatting import generate_coingecko_tickers
-            
-            pairs_data = extract_all_pairs_data()
-            if 'error' in pairs_data:
-                return PrettyJSONResponse(content={"error": "Failed to extract trading pairs data"}, status_code=503)
-            
-            pairs_list = pairs_data.get('pairs', [])
-            if not pairs_list:
-                return PrettyJSONResponse(content={"error": "No trading pairs available"}, status_code=503)
-            
-            tickers_data = generate_coingecko_tickers(pairs_list, use_cache=False)
-            return PrettyJSONResponse(content=tickers_data)
-        except Exception as e:
-            return PrettyJSONResponse(content={"error": f"Internal server error: {str(e)}"}, status_code=500)
     
-    @app.get("/coinmarketcap_live") 
-    async def get_coinmarketcap_live():
-        """Live CoinMarketCap endpoint - makes fresh RPC calls"""
-        try:
-            from data_integration import extract_all_pairs_data
-            from ticker_formatting import generate_coinmarketcap_enhanced_tickers
-            
-            pairs_data = extract_all_pairs_data()
-            if 'error' in pairs_data:
-                return PrettyJSONResponse(content={"error": "Failed to extract trading pairs data"}, status_code=503)
-            
-            pairs_list = pairs_data.get('pairs', [])
-            if not pairs_list:
-                return PrettyJSONResponse(content={"error": "No trading pairs available"}, status_code=503)
-            
-            tickers_data = generate_coinmarketcap_enhanced_tickers(pairs_list)
-            return PrettyJSONResponse(content=tickers_data)
-        except Exception as e:
-            return PrettyJSONResponse(content={"error": f"Internal server error: {str(e)}"}, status_code=500)
+    from data_integration import extract_all_pairs_data
+    from ticker_formatting import (
+        generate_coingecko_tickers,
+        generate_coinmarketcap_enhanced_tickers,
+        generate_coinpaprika_tickers,
+        format_iaddress_coinmarketcap_tickers
+    )
     
-    @app.get("/coinpaprika_live")
-    async def get_coinpaprika_live():
-        """Live Coinpaprika endpoint - makes fresh RPC calls"""
-        try:
-            from data_integration import extract_all_pairs_data
-            from ticker_formatting import generate_coinpaprika_tickers
-            import time
-            
-            pairs_data = extract_all_pairs_data()
-            if 'error' in pairs_data:
-                return PrettyJSONResponse(content={"error": "Failed to extract trading pairs data"}, status_code=503)
-            
-            pairs_list = pairs_data.get('pairs', [])
-            if not pairs_list:
-                return PrettyJSONResponse(content={"error": "No trading pairs available"}, status_code=503)
-            
-            tickers_data = generate_coinpaprika_tickers(pairs_list)
-            
-            # Wrap in VerusStatisticsAPI format to match v1
-            response_data = {
-                "code": "200000",
-                "data": {
-                    "time": int(time.time() * 1000),  # Current timestamp in milliseconds
-                    "ticker": tickers_data
-                }
+    # Live endpoints requested within a few seconds of each other share one extraction
+    LIVE_PAIRS_CACHE_TTL = 5.0
+    _live_pairs_cache = {"data": None, "fetched_at": 0.0}
+    _live_pairs_lock = asyncio.Lock()
+    
+    async def _get_live_pairs_data():
+        """
+        Extract trading pairs for the live endpoints, reusing an extraction younger than LIVE_PAIRS_CACHE_TTL
+        Concurrent requests wait on the lock, so a burst of live calls triggers a single RPC extraction
+        
+        Returns:
+            dict: Result of extract_all_pairs_data
+        """
+        async with _live_pairs_lock:
+            now = time.monotonic()
+            if _live_pairs_cache["data"] is not None and now - _live_pairs_cache["fetched_at"] < LIVE_PAIRS_CACHE_TTL:
+                return _live_pairs_cache["data"]
+            
+            pairs_data = await asyncio.to_thread(extract_all_pairs_data)
+            
+            # Failed extractions are not reused
+            if 'error' not in pairs_data:
+                _live_pairs_cache.update(data=pairs_data, fetched_at=time.monotonic())
+            return pairs_data
+    
+    # Formatter -> (pairs_data it was built from, tickers); one entry per live ticker format
+    _live_tickers_cache = {}
+    
+    async def _format_live_tickers(pairs_data, formatter, *args, **kwargs):
+        """
+        Run a ticker formatter off the event loop, reusing its output while the same live extraction is served
+        
+        Args:
+            pairs_data: Result of _get_live_pairs_data
+            formatter: Ticker formatting function taking the pairs list
+            
+        Returns:
+            Formatted ticker data
+        """
+        cached = _live_tickers_cache.get(formatter)
+        if cached is not None and cached[0] is pairs_data:
+            return cached[1]
+        
+        tickers_data = await asyncio.to_thread(formatter, pairs_data.get('pairs', []), *args, **kwargs)
+        _live_tickers_cache[formatter] = (pairs_data, tickers_data)
+        return tickers_data
+    
+    def _wrap_coinpaprika_response(tickers_data):
+        """Wrap tickers in VerusStatisticsAPI format to match v1"""
+        return {
+            "code": "200000",
+            "data": {
+                "time": time.time_ns() // 1_000_000,  # Current timestamp in milliseconds
+                "ticker": tickers_data
             }
-            
-            return PrettyJSONResponse(content=response_data)
-        except Exception as e:
-            return PrettyJSONResponse(content={"error": f"Internal server error: {str(e)}"}, status_code=500)
+        }
     
-    @app.get("/coinmarketcap_iaddress_live")
-    async def get_coinmarketcap_iaddress_live():
-        """Live CMC I-Address endpoint - makes fresh RPC calls"""
-        try:
-            from data_integration import extract_all_pairs_data
-            from ticker_formatting import format_iaddress_coinmarketcap_tickers
-            
-            pairs_data = extract_all_pairs_data()
-            if 'error' in pairs_data:
-                return PrettyJSONResponse(content={"error": "Failed to extract trading pairs data"}, status_code=503)
-            
-            pairs_list = pairs_data.get('pairs', [])
-            if not pairs_list:
-                return PrettyJSONResponse(content={"error": "No trading pairs available"}, status_code=503)
-            
-            tickers_data = format_iaddress_coinmarketcap_tickers(pairs_list)
-            return PrettyJSONResponse(content=tickers_data)
-        except Exception as e:
-            return PrettyJSONResponse(content={"error": f"Internal server error: {str(e)}"}, status_code=500)
-else:
-    # Disabled endpoints - return informative error messages
-    @app.get("/coingecko_live")
-    async def get_coingecko_disabled():
-        return PrettyJSONResponse(
-            content={
-                "error": "Live endpoints are disabled",
-                "message": "This endpoint makes fresh RPC calls and is disabled for production use",
-                "alternatives": {
-                    "cached_endpoint": "/coingecko",
-                    "description": "Use the cached version for production - 60x faster response times"
-                },
-                "enable_instructions": "Set ENABLE_LIVE_ENDPOINTS=true in .env file to enable live endpoints"
-            },
-            status_code=503
+    # Fixed 503 error message -> (compact body, ?pretty=1 body), encoded once at import
+    LIVE_ERROR_BODIES = {
+        message: (
+            orjson.dumps({"error": message}),
+            orjson.dumps({"error": message}, option=orjson.OPT_INDENT_2)
         )
+        for message in ("Failed to extract trading pairs data", "No trading pairs available")
+    }
     
-    @app.get("/coinmarketcap_live")
-    async def get_coinmarketcap_disabled():
-        return PrettyJSONResponse(
-            content={
-                "error": "Live endpoints are disabled",
-                "message": "This endpoint makes fresh RPC calls and is disabled for production use",
-                "alternatives": {
-                    "cached_endpoint": "/coinmarketcap",
-                    "description": "Use the cached version for production - 60x faster response times"
-                },
-                "enable_instructions": "Set ENABLE_LIVE_ENDPOINTS=true in .env file to enable live endpoints"
-            },
+    def _live_error_response(message):
+        compact_body, pretty_body = LIVE_ERROR_BODIES[message]
+        return Response(
+            content=pretty_body if _pretty_json_requested.get() else compact_body,
+            media_type="application/json",
             status_code=503
         )
     
-    @app.get("/coinpaprika_live")
-    async def get_coinpaprika_disabled():
-        return PrettyJSONResponse(
-            content={
-                "error": "Live endpoints are disabled",
-                "message": "This endpoint makes fresh RPC calls and is disabled for production use",
-                "alternatives": {
-                    "cached_endpoint": "/coinpaprika",
-                    "description": "Use the cached version for production - 60x faster response times"
-                },
-                "enable_instructions": "Set ENABLE_LIVE_ENDPOINTS=true in .env file to enable live endpoints"
+    def _make_live_handler(formatter, wrap_response=None, **formatter_kwargs):
+        """
+        Build a live endpoint handler that formats freshly extracted pairs with the given formatter
+        
+        Args:
+            formatter: Ticker formatting function taking the pairs list
+            wrap_response: Optional function wrapping the formatted tickers into the response body
+            **formatter_kwargs: Extra keyword arguments for the formatter
+        """
+        async def live_handler():
+            try:
+                pairs_data = await _get_live_pairs_data()
+                if 'error' in pairs_data:
+                    return _live_error_response("Failed to extract trading pairs data")
+                
+                pairs_list = pairs_data.get('pairs', [])
+                if not pairs_list:
+                    return _live_error_response("No trading pairs available")
+                
+                tickers_data = await _format_live_tickers(pairs_data, formatter, **formatter_kwargs)
+                if wrap_response is not None:
+                    tickers_data = wrap_response(tickers_data)
+                return PrettyJSONResponse(content=tickers_data)
+            except Exception as e:
+                return PrettyJSONResponse(content={"error": f"Internal server error: {str(e)}"}, status_code=500)
+        
+        return live_handler
+    
+    # Live endpoints implementation: (path, route name, formatter, response wrapper, formatter kwargs)
+    LIVE_ENDPOINT_SPECS = [
+        ("/coingecko_live", "get_coingecko_live", generate_coingecko_tickers, None, {"use_cache": False}),
+        ("/coinmarketcap_live", "get_coinmarketcap_live", generate_coinmarketcap_enhanced_tickers, None, {}),
+        ("/coinpaprika_live", "get_coinpaprika_live", generate_coinpaprika_tickers, _wrap_coinpaprika_response, {}),
+        ("/coinmarketcap_iaddress_live", "get_coinmarketcap_iaddress_live", format_iaddress_coinmarketcap_tickers, None, {}),
+    ]
+    
+    for path, route_name, formatter, wrap_response, formatter_kwargs in LIVE_ENDPOINT_SPECS:
+        app.get(path, name=route_name)(_make_live_handler(formatter, wrap_response, **formatter_kwargs))
+else:
+    logger.info("✅ Live endpoints are DISABLED - use cached endpoints for production")
+    
+    # Disabled endpoints - return informative error messages, encoded once at import
+    def _live_disabled_payload(cached_endpoint):
+        return {
+            "error": "Live endpoints are disabled",
+            "message": "This endpoint makes fresh RPC calls and is disabled for production use",
+            "alternatives": {
+                "cached_endpoint": cached_endpoint,
+                "description": "Use the cached version for production - 60x faster response times"
             },
-            status_code=503
+            "enable_instructions": "Set ENABLE_LIVE_ENDPOINTS=true in .env file to enable live endpoints"
+        }
+    
+    # Cached endpoint -> (compact body, ?pretty=1 body)
+    LIVE_DISABLED_BODIES = {
+        cached_endpoint: (
+            orjson.dumps(_live_disabled_payload(cached_endpoint)),
+            orjson.dumps(_live_disabled_payload(cached_endpoint), option=orjson.OPT_INDENT_2)
         )
+        for cached_endpoint in ("/coingecko", "/coinmarketcap", "/coinpaprika", "/coinmarketcap_iaddress")
+    }
     
-    @app.get("/coinmarketcap_iaddress_live")
-    async def get_coinmarketcap_iaddress_disabled():
-        return PrettyJSONResponse(
-            content={
-                "error": "Live endpoints are disabled",
-                "message": "This endpoint makes fresh RPC calls and is disabled for production use",
-                "alternatives": {
-                    "cached_endpoint": "/coinmarketcap_iaddress",
-                    "description": "Use the cached version for production - 60x faster response times"
-                },
-                "enable_instructions": "Set ENABLE_LIVE_ENDPOINTS=true in .env file to enable live endpoints"
-            },
+    def _live_disabled_response(cached_endpoint):
+        compact_body, pretty_body = LIVE_DISABLED_BODIES[cached_endpoint]
+        return Response(
+            content=pretty_body if _pretty_json_requested.get() else compact_body,
+            media_type="application/json",
             status_code=503
         )
+    
+    def _make_live_disabled_handler(cached_endpoint):
+        async def live_disabled_handler():
+            return _live_disabled_response(cached_endpoint)
+        return live_disabled_handler
+    
+    for cached_endpoint in LIVE_DISABLED_BODIES:
+        app.get(f"{cached_endpoint}_live", name=f"get_{cached_endpoint.lstrip('/')}_disabled")(
+            _make_live_disabled_handler(cached_endpoint)
+        )
 
 
 
 # Removed unused /enhanced endpoint
 
+# Seconds to wait for processes to exit after SIGTERM before sending SIGKILL
+PORT_RELEASE_TIMEOUT = 2.0
+
+def _process_running(pid):
+    """Check whether a process with the given PID still exists"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
 def kill_process_on_port(port):
     """Kill any process running on the specified port"""
     try:
@@ -1215,17 +1378,24 @@ def kill_process_on_port(port):
         )
         
         if result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
+            pids = [int(pid) for pid in result.stdout.strip().split('\n') if pid]
             for pid in pids:
-                if pid:
-                    print(f"Killing process {pid} on port {port}")
-                    os.kill(int(pid), signal.SIGTERM)
-                    time.sleep(1)
-                    # Force kill if still running
-                    try:
-                        os.kill(int(pid), signal.SIGKILL)
-                    except ProcessLookupError:
-                        pass
+                print(f"Killing process {pid} on port {port}")
+                os.kill(pid, signal.SIGTERM)
+            
+            # Wait only as long as the processes take to exit, up to the timeout
+            deadline = time.monotonic() + PORT_RELEASE_TIMEOUT
+            while pids and time.monotonic() < deadline:
+                pids = [pid for pid in pids if _process_running(pid)]
+                if pids:
+                    time.sleep(0.05)
+            
+            # Force kill if still running
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
             print(f"Cleared port {port}")
         else:
             print(f"Port {port} is free")
@@ -1237,7 +1407,7 @@ def kill_process_on_port(port):
 # ============================================================================
 
 @app.get("/coingecko")
-async def get_coingecko_tickers_cached():
+async def get_coingecko_tickers_cached(request: Request):
     """
     Get all tickers in CoinGecko format (CACHED VERSION)
     
@@ -1255,7 +1425,6 @@ async def get_coingecko_tickers_cached():
         from ticker_formatting import generate_coingecko_tickers
         from cache_manager import get_cached_pairs_data_only
         from cache_manager import get_cache_status
-        import json
         
         logger.info("🚀 CoinGecko cached endpoint called")
         
@@ -1264,7 +1433,7 @@ async def get_coingecko_tickers_cached():
         
         if 'error' in raw_data:
             logger.error(f"Error getting cached data: {raw_data['error']}")
-            error_json = json.dumps({"error": "No cached data available"}, indent=2)
+            error_json = pretty_json_dumps({"error": "No cached data available"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1278,7 +1447,7 @@ async def get_coingecko_tickers_cached():
         
         if not tickers:
             logger.error("No CoinGecko tickers available")
-            error_json = json.dumps({"error": "No ticker data available"}, indent=2)
+            error_json = pretty_json_dumps({"error": "No ticker data available"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1292,17 +1461,13 @@ async def get_coingecko_tickers_cached():
         # Cache info is available via /cache_status endpoint for monitoring
         
         # Convert to pretty-printed JSON
-        pretty_json = json.dumps(tickers, indent=2, ensure_ascii=False)
+        pretty_json = pretty_json_dumps(tickers)
         
-        return Response(
-            content=pretty_json,
-            media_type="application/json",
-            headers={"Content-Type": "application/json; charset=utf-8"}
-        )
+        return cached_ticker_response(request, pretty_json)
         
     except Exception as e:
         logger.error(f"❌ Error in coingecko_cached endpoint: {e}")
-        error_json = json.dumps({"error": str(e)}, indent=2)
+        error_json = pretty_json_dumps({"error": str(e)})
         return Response(
             content=error_json,
             media_type="application/json",
@@ -1310,7 +1475,7 @@ async def get_coingecko_tickers_cached():
         )
 
 @app.get("/coinmarketcap")
-async def get_cmc_summary_cached():
+async def get_cmc_summary_cached(request: Request):
     """
     Get enhanced ticker data in CoinMarketCap (CMC) DEX format (CACHED VERSION)
     
@@ -1329,7 +1494,6 @@ async def get_cmc_summary_cached():
         from ticker_formatting import generate_coinmarketcap_enhanced_tickers
         from cache_manager import get_cached_pairs_data_only
         from cache_manager import get_cache_status
-        import json
         
         logger.info("🚀 Enhanced CMC DEX cached endpoint called")
         
@@ -1338,7 +1502,7 @@ async def get_cmc_summary_cached():
         
         if 'error' in raw_data:
             logger.error(f"Error getting cached data: {raw_data['error']}")
-            error_json = json.dumps({"error": "No cached data available"}, indent=2)
+            error_json = pretty_json_dumps({"error": "No cached data available"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1352,7 +1516,7 @@ async def get_cmc_summary_cached():
         
         if not enhanced_tickers:
             logger.error("No enhanced CMC tickers available")
-            error_json = json.dumps({"error": "No ticker data available"}, indent=2)
+            error_json = pretty_json_dumps({"error": "No ticker data available"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1366,17 +1530,13 @@ async def get_cmc_summary_cached():
         # Cache info is available via /cache_status endpoint for monitoring
         
         # Convert to pretty-printed JSON
-        pretty_json = json.dumps(enhanced_tickers, indent=2, ensure_ascii=False)
+        pretty_json = pretty_json_dumps(enhanced_tickers)
         
-        return Response(
-            content=pretty_json,
-            media_type="application/json",
-            headers={"Content-Type": "application/json; charset=utf-8"}
-        )
+        return cached_ticker_response(request, pretty_json)
         
     except Exception as e:
         logger.error(f"❌ Error in coinmarketcap_cached endpoint: {e}")
-        error_json = json.dumps({"error": str(e)}, indent=2)
+        error_json = pretty_json_dumps({"error": str(e)})
         return Response(
             content=error_json,
             media_type="application/json",
@@ -1410,7 +1570,6 @@ async def get_coinpaprika():
         from ticker_formatting import generate_coinpaprika_tickers
         from cache_manager import get_cached_pairs_data_only
         from fastapi.responses import Response
-        import json
         
         logger.info("🚀 Coinpaprika endpoint called")
         
@@ -1419,7 +1578,7 @@ async def get_coinpaprika():
         
         if 'error' in pairs_data:
             logger.error(f"Error extracting pairs data: {pairs_data['error']}")
-            error_json = json.dumps({"error": "Failed to extract trading pairs data"}, indent=2)
+            error_json = pretty_json_dumps({"error": "Failed to extract trading pairs data"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1437,11 +1596,11 @@ async def get_coinpaprika():
             empty_response = {
                 "code": "200000",
                 "data": {
-                    "time": int(time.time() * 1000),  # Current timestamp in milliseconds
+                    "time": time.time_ns() // 1_000_000,  # Current timestamp in milliseconds
                     "ticker": []
                 }
             }
-            empty_json = json.dumps(empty_response, indent=2)
+            empty_json = pretty_json_dumps(empty_response)
             return Response(
                 content=empty_json,
                 media_type="application/json",
@@ -1452,12 +1611,12 @@ async def get_coinpaprika():
         response_data = {
             "code": "200000",
             "data": {
-                "time": int(time.time() * 1000),  # Current timestamp in milliseconds
+                "time": time.time_ns() // 1_000_000,  # Current timestamp in milliseconds
                 "ticker": tickers
             }
         }
         
-        response_json = json.dumps(response_data, indent=2)
+        response_json = pretty_json_dumps(response_data)
         logger.info(f"✅ Coinpaprika: returning {len(tickers)} tickers")
         
         return Response(
@@ -1479,7 +1638,7 @@ async def get_coinpaprika():
 
 
 @app.get("/coinmarketcap_iaddress")
-async def get_coinmarketcap_iaddress():
+async def get_coinmarketcap_iaddress(request: Request):
     """
     CoinMarketCap I-Address Format - TESTING ENDPOINT
     ===============================================
@@ -1523,7 +1682,7 @@ async def get_coinmarketcap_iaddress():
         
         if 'error' in pairs_response or not pairs_response.get('pairs'):
             logger.error("No cached pairs data available for I-Address CMC endpoint")
-            error_json = json.dumps({"error": "No ticker data available"}, indent=2)
+            error_json = pretty_json_dumps({"error": "No ticker data available"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1538,7 +1697,7 @@ async def get_coinmarketcap_iaddress():
         
         if not formatted_tickers:
             logger.error("No I-Address CMC tickers generated")
-            error_json = json.dumps({"error": "No ticker data available"}, indent=2)
+            error_json = pretty_json_dumps({"error": "No ticker data available"})
             return Response(
                 content=error_json,
                 media_type="application/json",
@@ -1548,17 +1707,13 @@ async def get_coinmarketcap_iaddress():
         logger.info(f"✅ Returning {len(formatted_tickers)} I-Address CMC tickers")
         
         # Convert to pretty-printed JSON
-        pretty_json = json.dumps(formatted_tickers, indent=2, ensure_ascii=False)
+        pretty_json = pretty_json_dumps(formatted_tickers)
         
-        return Response(
-            content=pretty_json,
-            media_type="application/json",
-            headers={"Content-Type": "application/json; charset=utf-8"}
-        )
+        return cached_ticker_response(request, pretty_json)
         
     except Exception as e:
         logger.error(f"❌ Error in I-Address CMC endpoint: {e}")
-        error_json = json.dumps({"error": str(e)}, indent=2)
+        error_json = pretty_json_dumps({"error": str(e)})
         return Response(
             content=error_json,
             media_type="application/json",
@@ -1585,25 +1740,13 @@ async def validate_endpoints():
     try:
         from validation_endpoint import run_validation
         from fastapi.responses import Response
-        import json
         
         logger.info("🔍 API Validation endpoint called")
         
         # Run comprehensive validation
         validation_results = run_validation()
         
-        # Custom JSON serialization to prevent scientific notation
-        def decimal_serializer(obj):
-            if isinstance(obj, float):
-                return f"{obj:.8f}"
-            return obj
-            
-        pretty_json = json.dumps(
-            validation_results, 
-            indent=2, 
-            ensure_ascii=False,
-            default=decimal_serializer
-        )
+        pretty_json = pretty_json_dumps(validation_results)
         
         # Log validation summary
         overall_status = validation_results.get("overall_status", "UNKNOWN")
@@ -1628,7 +1771,7 @@ async def validate_endpoints():
             },
             "message": "Validation endpoint encountered an error"
         }
-        error_json = json.dumps(error_response, indent=2)
+        error_json = pretty_json_dumps(error_response)
         return Response(
             content=error_json,
             media_type="application/json",
@@ -1646,11 +1789,10 @@ async def clear_cache_endpoint():
     try:
         from fastapi.responses import Response
         from ticker_formatting_cached import clear_cache
-        import json
         
         result = clear_cache()
         
-        pretty_json = json.dumps(result, indent=2, ensure_ascii=False)
+        pretty_json = pretty_json_dumps(result)
         
         return Response(
             content=pretty_json,
@@ -1660,7 +1802,7 @@ async def clear_cache_endpoint():
         
     except Exception as e:
         logger.error(f"❌ Error in cache_clear endpoint: {e}")
-        error_json = json.dumps({"error": str(e)}, indent=2)
+        error_json = pretty_json_dumps({"error": str(e)})
         return Response(
             content=error_json,
             media_type="application/json",
@@ -1668,20 +1810,28 @@ async def clear_cache_endpoint():
         )
 
 if __name__ == "__main__":
-    import uvicorn
-    
     # Kill any existing processes on the port
     kill_process_on_port(8765)
     
-    print("Starting Verus Ticker API on port 8765")
-    
-    # Initialize cache manager and start background refresh
-    print("Initializing cache manager...")
-    from cache_manager import get_cache_manager
-    cache_manager = get_cache_manager(cache_ttl_seconds=60)
-    print("Cache manager initialized with background refresh enabled")
+    # Worker processes to serve with; each worker keeps its own cache and background refresh
+    workers = int(os.getenv('WEB_CONCURRENCY', '1'))
     
-    print("Launching FastAPI server on http://localhost:8765")
+    print(f"Starting Verus Ticker API on port 8765 ({workers} worker{'s' if workers > 1 else ''})")
     
-    # Run the server
-    uvicorn.run(app, host="0.0.0.0", port=8765)
+    if workers > 1:
+        print("Launching FastAPI server on http://localhost:8765")
+        
+        # Workers import the app themselves and initialize their cache managers on first use
+        uvicorn.run("main:app", host="0.0.0.0", port=8765, workers=workers, access_log=ACCESS_LOG,
+                    app_dir=os.path.dirname(os.path.abspath(__file__)))
+    else:
+        # Initialize cache manager and start background refresh
+        print("Initializing cache manager...")
+        from cache_manager import get_cache_manager
+        cache_manager = get_cache_manager(cache_ttl_seconds=60)
+        print("Cache manager initialized with background refresh enabled")
+        
+        print("Launching FastAPI server on http://localhost:8765")
+        
+        # Run the server
+        uvicorn.run(app, host="0.0.0.0", port=8765, access_log=ACCESS_LOG)
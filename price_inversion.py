@@ -37,19 +37,20 @@ def invert_ohlc_prices(raw_prices):
         'close': invert_price(raw_prices.get('close', 0))
     }
 
-def apply_universal_price_inversion(pair_data):
+def apply_universal_price_inversion(pair_data, in_place=False):
     """
     Apply universal price inversion to pair data
     Only inverts OHLC prices, keeps volumes and metadata unchanged
     
     Args:
         pair_data (dict): Complete pair data with volumes and prices
+        in_place (bool): Update pair_data itself instead of a copy (for freshly built dicts)
     
     Returns:
         dict: Pair data with inverted OHLC prices (volumes unchanged)
     """
-    # Create a copy to avoid modifying original data
-    inverted_data = pair_data.copy()
+    # Create a copy to avoid modifying original data, unless the caller owns it
+    inverted_data = pair_data if in_place else pair_data.copy()
     
     # Extract raw OHLC prices
     raw_prices = {
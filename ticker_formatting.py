@@ -15,19 +15,28 @@ import os
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from dict import normalize_currency_name, get_ticker_by_id, get_mapped_eth_symbol, get_mapped_vrsc_symbol, is_currency_exported_to_ethereum
+from dict import get_ticker_by_id, get_mapped_eth_symbol, get_mapped_vrsc_symbol, is_currency_exported_to_ethereum
 from data_integration import load_converter_data
 from liquidity_calculator import get_pair_liquidity
 
 logger = logging.getLogger(__name__)
 
-def format_coingecko_ticker(pair_data: Dict, use_cache: bool = False) -> Dict:
+def get_converter_pool_ids() -> Dict[str, str]:
+    """Map each discovered converter name to its currency ID (the CoinGecko pool_id)"""
+    pool_ids = {}
+    for conv in load_converter_data() or ():
+        pool_ids.setdefault(conv.get('name'), conv.get('currency_id', conv.get('name')))
+    return pool_ids
+
+def format_coingecko_ticker(pair_data: Dict, use_cache: bool = False, pool_ids: Optional[Dict] = None) -> Dict:
     """
     Format a single pair into CoinGecko ticker format
     Based on correct Deploy/coingecko_tickers.json format
     
     Args:
         pair_data: Raw pair data from data integration
+        use_cache: If True, use cache-only data sources and pre-calculated values
+        pool_ids: Optional get_converter_pool_ids result, loaded here when not given
     
     Returns:
         Dict in CoinGecko ticker format
@@ -53,15 +62,9 @@ def format_coingecko_ticker(pair_data: Dict, use_cache: bool = False) -> Dict:
         ticker_id = f"{base_symbol}-{target_symbol}"
         
         # Get converter currency_id for pool_id
-        # Load converter discovery data to get currency_id
-        converter_data = load_converter_data()
-        pool_id = converter
-        if converter_data:
-            # converter_data is a list of converter dictionaries
-            for conv in converter_data:
-                if conv.get('name') == converter:
-                    pool_id = conv.get('currency_id', converter)
-                    break
+        if pool_ids is None:
+            pool_ids = get_converter_pool_ids()
+        pool_id = pool_ids.get(converter, converter)
         
         # Format all numbers to 8 decimal places as strings
         last_price = f"{float(pair_data.get('last', 0)):.8f}"
@@ -75,13 +78,11 @@ def format_coingecko_ticker(pair_data: Dict, use_cache: bool = False) -> Dict:
         bid_price = last_price
         ask_price = last_price
         
-        # Calculate liquidity - use cache or calculate fresh
-        if use_cache:
-            # Use pre-calculated liquidity from cached data
-            pair_liquidity_usd = pair_data.get('pair_liquidity_usd', 0.0)
-        else:
-            # Calculate actual pair liquidity using the formula
-            pair_liquidity_usd = get_pair_liquidity(converter, base_currency, target_currency, converter_data)
+        # Liquidity is calculated per converter during extract_all_pairs_data; only pairs
+        # built elsewhere fall back to a per-pair calculation on the live path
+        pair_liquidity_usd = pair_data.get('pair_liquidity_usd')
+        if pair_liquidity_usd is None:
+            pair_liquidity_usd = 0.0 if use_cache else get_pair_liquidity(converter, base_currency, target_currency, load_converter_data())
         
         liquidity_usd_formatted = f"{pair_liquidity_usd:.8f}"
         
@@ -126,6 +127,9 @@ def generate_coingecko_tickers(pairs_data: List[Dict], use_cache: bool = False)
         tickers = []
         excluded_count = 0
         
+        # Converter pool IDs are looked up once for all pairs
+        pool_ids = get_converter_pool_ids()
+        
         logger.info(f"🚀 Processing {len(pairs_data)} pairs for CoinGecko format (cache={use_cache})")
         
         for i, pair in enumerate(pairs_data):
@@ -140,7 +144,7 @@ def generate_coingecko_tickers(pairs_data: List[Dict], use_cache: bool = False)
                     logger.debug(f"🚫 Excluding converter pair: {pair.get('base_currency', '')}-{pair.get('target_currency', '')}")
                     continue
                 
-                ticker = format_coingecko_ticker(pair, use_cache)
+                ticker = format_coingecko_ticker(pair, use_cache, pool_ids)
                 if ticker:  # Only add valid tickers
                     tickers.append(ticker)
             else:
@@ -507,13 +511,9 @@ def format_verus_statistics_ticker(pair_data: Dict) -> Dict:
         base_currency = pair_data.get('base_currency', '')
         target_currency = pair_data.get('target_currency', '')
         
-        # Normalize currency names for display
-        base_norm = normalize_currency_name(base_currency)
-        target_norm = normalize_currency_name(target_currency)
-        
         # Create symbol (dash-separated for VerusStatistics format)
-        symbol = f"{base_norm}-{target_norm}"
-        symbol_name = f"{base_norm}/{target_norm}"
+        symbol = f"{base_currency}-{target_currency}"
+        symbol_name = f"{base_currency}/{target_currency}"
         
         return {
             "symbol": symbol,
@@ -545,13 +545,9 @@ def format_verus_statistics_ticker_enhanced(pair_data: Dict) -> Dict:
         target_currency = pair_data.get('target_currency', '')
         converter = pair_data.get('converter', '')
         
-        # Normalize currency names for display
-        base_norm = normalize_currency_name(base_currency)
-        target_norm = normalize_currency_name(target_currency)
-        
         # Create symbol (dash-separated for VerusStatistics format)
-        symbol = f"{base_norm}-{target_norm}"
-        symbol_name = f"{base_norm}/{target_norm}"
+        symbol = f"{base_currency}-{target_currency}"
+        symbol_name = f"{base_currency}/{target_currency}"
         
         # Get pool_id from converter data
         pool_id = get_converter_pool_id(converter)
@@ -652,7 +648,15 @@ def format_cmc_dex_ticker(pair_data: Dict) -> tuple:
         logger.error(f"Error formatting CMC DEX ticker: {e}")
         return None, {}
 
-def format_cmc_enhanced_ticker(pair_data: Dict, use_cache: bool = False) -> tuple:
+def _mapped_eth_address(currency_id: str, currency_info: Optional[Dict]) -> Optional[str]:
+    """Ethereum contract address for a currency ID, from prebuilt bulk_currency_info data when it covers the ID"""
+    info = currency_info.get(currency_id) if currency_info is not None else None
+    if info is not None:
+        return info['mappedethaddress']
+    from dict import get_mapped_eth_address
+    return get_mapped_eth_address(currency_id)
+
+def format_cmc_enhanced_ticker(pair_data: Dict, use_cache: bool = False, currency_info: Optional[Dict] = None) -> tuple:
     """
     Format a single pair into Enhanced CoinMarketCap (CMC) DEX format
     Uses Ethereum contract symbols and addresses when available
@@ -660,6 +664,7 @@ def format_cmc_enhanced_ticker(pair_data: Dict, use_cache: bool = False) -> tupl
     Args:
         pair_data: Raw pair data from data integration
         use_cache: If True, use cache-only data sources and pre-calculated values
+        currency_info: Optional bulk_currency_info result covering the pairs' currency IDs
     
     Returns:
         Tuple of (composite_key, ticker_data) for enhanced DEX object format
@@ -667,17 +672,14 @@ def format_cmc_enhanced_ticker(pair_data: Dict, use_cache: bool = False) -> tupl
     try:
         if use_cache:
             # Cache-only version - use pre-calculated data, avoid RPC calls
-            from dict import normalize_currency_name, get_mapped_eth_symbol, get_mapped_eth_address, get_currency_id_by_name
+            from dict import get_mapped_eth_symbol, get_currency_id_by_name
             
             base_currency = pair_data.get('base_currency', '')
             target_currency = pair_data.get('target_currency', '')
             
-            # Get normalized names and symbols
-            base_normalized = normalize_currency_name(base_currency)
-            target_normalized = normalize_currency_name(target_currency)
-            
-            base_symbol = get_mapped_eth_symbol(base_normalized)
-            target_symbol = get_mapped_eth_symbol(target_normalized)
+            # Get symbols
+            base_symbol = get_mapped_eth_symbol(base_currency)
+            target_symbol = get_mapped_eth_symbol(target_currency)
             
             # Skip pairs with missing symbol mappings
             if base_symbol is None or target_symbol is None:
@@ -685,18 +687,18 @@ def format_cmc_enhanced_ticker(pair_data: Dict, use_cache: bool = False) -> tupl
                 return None, None
             
             # Get Ethereum contract addresses for base_id and quote_id
-            base_currency_id = get_currency_id_by_name(base_normalized)
-            target_currency_id = get_currency_id_by_name(target_normalized)
+            base_currency_id = get_currency_id_by_name(base_currency)
+            target_currency_id = get_currency_id_by_name(target_currency)
             
-            base_id = get_mapped_eth_address(base_currency_id) if base_currency_id else ""
-            quote_id = get_mapped_eth_address(target_currency_id) if target_currency_id else ""
+            base_id = _mapped_eth_address(base_currency_id, currency_info) if base_currency_id else ""
+            quote_id = _mapped_eth_address(target_currency_id, currency_info) if target_currency_id else ""
             
             # Create composite key using contract addresses (same as live endpoint)
             composite_key = f"{base_id}_{quote_id}"
             
         else:
             # Live version - can make RPC calls
-            from dict import get_symbol_for_currency, get_mapped_eth_address
+            from dict import get_symbol_for_currency
             
             base_currency = pair_data.get('base_currency', '')
             target_currency = pair_data.get('target_currency', '')
@@ -708,8 +710,8 @@ def format_cmc_enhanced_ticker(pair_data: Dict, use_cache: bool = False) -> tupl
             target_symbol = get_symbol_for_currency(target_currency_id) or target_currency
             
             # Use contract addresses as IDs if available, otherwise use currency IDs
-            base_id = get_mapped_eth_address(base_currency_id) or base_currency_id or base_currency
-            quote_id = get_mapped_eth_address(target_currency_id) or target_currency_id or target_currency
+            base_id = _mapped_eth_address(base_currency_id, currency_info) or base_currency_id or base_currency
+            quote_id = _mapped_eth_address(target_currency_id, currency_info) or target_currency_id or target_currency
             
             # Create composite key using contract addresses when available
             composite_key = f"{base_id}_{quote_id}"
@@ -1079,7 +1081,15 @@ def generate_coinmarketcap_enhanced_tickers(pairs_data: List[Dict], use_cache: b
         Uses proper composite keys per CMC DEX specification (excluding converter pairs)
     """
     try:
-        from dict import is_converter_currency
+        from dict import is_converter_currency, bulk_currency_info
+        
+        # Resolve contract addresses for every currency in the pairs with one mapping pass
+        currency_info = bulk_currency_info({
+            currency_id
+            for pair_data in pairs_data
+            for currency_id in (pair_data.get('base_currency_id'), pair_data.get('target_currency_id'))
+            if currency_id
+        })
         
         # Temporary storage for aggregation
         pair_aggregation = {}
@@ -1096,7 +1106,7 @@ def generate_coinmarketcap_enhanced_tickers(pairs_data: List[Dict], use_cache: b
                 logger.debug(f"🚫 Excluding converter pair: {pair_data.get('base_currency', '')}-{pair_data.get('target_currency', '')}")
                 continue
             
-            composite_key, ticker_data = format_cmc_enhanced_ticker(pair_data, use_cache)
+            composite_key, ticker_data = format_cmc_enhanced_ticker(pair_data, use_cache, currency_info)
             if composite_key and ticker_data:
                 if composite_key in pair_aggregation:
                     # Aggregate with existing data
@@ -11,12 +11,31 @@ import os
 import sys
 import json
 import requests
+import threading
 import time
 import urllib.parse
 from dotenv import load_dotenv
 
 # Import currency mapping from the official dict.py
-from dict import normalize_currency_name, get_ticker_by_id
+from dict import get_ticker_by_id
+
+# One HTTP session per thread, so connections to each daemon are kept alive instead of
+# opening a new TCP connection per call; requests does not guarantee a Session is
+# thread-safe, and RPC calls run from executor, to_thread and cache refresh threads
+_rpc_local = threading.local()
+
+def _get_rpc_session():
+    """Get this thread's RPC session, creating it on first use"""
+    session = getattr(_rpc_local, 'session', None)
+    if session is None:
+        session = _rpc_local.session = requests.Session()
+    return session
+
+# Seconds allowed per RPC call; batch requests get this much per call they carry
+RPC_TIMEOUT = 30
+
+# Most calls sent in one JSON-RPC batch request
+RPC_BATCH_SIZE = 8
 
 def get_default_port(chain):
     """Get default RPC port for a given chain"""
@@ -43,11 +62,8 @@ def make_verus_rpc(method, params=None):
     """Make an RPC call to the Verus daemon"""
     return make_rpc_call("VRSC", method, params)
 
-def make_rpc_call(chain, method, params=None, config=None):
-    """Make an RPC call to the specified chain daemon"""
-    if params is None:
-        params = []
-    
+def get_rpc_connection(chain):
+    """Get the RPC URL and credentials for the specified chain daemon"""
     # Force reload environment variables for each call
     load_dotenv(".env", override=True)
     
@@ -66,8 +82,16 @@ def make_rpc_call(chain, method, params=None, config=None):
     
     print(f"Using RPC connection: {host}:{port} with user {user} for {chain}")
     
+    return f"http://{host}:{port}", user, password
+
+def make_rpc_call(chain, method, params=None, config=None):
+    """Make an RPC call to the specified chain daemon"""
+    if params is None:
+        params = []
+    
+    url, user, password = get_rpc_connection(chain)
+    
     # Prepare request
-    url = f"http://{host}:{port}"
     headers = {"content-type": "application/json"}
     payload = {
         "method": method,
@@ -78,12 +102,12 @@ def make_rpc_call(chain, method, params=None, config=None):
     
     try:
         # Make request with basic auth
-        response = requests.post(
+        response = _get_rpc_session().post(
             url,
             auth=(user, password),
             headers=headers,
             json=payload,
-            timeout=30,
+            timeout=RPC_TIMEOUT,
         )
         
         # Check for HTTP errors
@@ -106,6 +130,91 @@ def make_rpc_call(chain, method, params=None, config=None):
         print(f"Exception making RPC call: {str(e)}")
         return None
 
+def make_rpc_batch(chain, calls):
+    """Make several RPC calls to the specified chain daemon as JSON-RPC batch requests
+    
+    Calls are sent RPC_BATCH_SIZE at a time, so one slow daemon response cannot time out
+    every call for the chain. A chunk whose batch request fails is retried one call at a time.
+    
+    Args:
+        chain (str): Chain name (VRSC, CHIPS, VARRR, VDEX)
+        calls (list): List of (method, params) tuples
+        
+    Returns:
+        list: Results in the same order as calls, None for calls that failed
+    """
+    if not calls:
+        return []
+    
+    url, user, password = get_rpc_connection(chain)
+    
+    results = []
+    for start in range(0, len(calls), RPC_BATCH_SIZE):
+        chunk = calls[start:start + RPC_BATCH_SIZE]
+        chunk_results = _post_rpc_batch(url, user, password, chunk)
+        if chunk_results is None:
+            print(f"Retrying {len(chunk)} {chain} RPC calls individually after failed batch request")
+            chunk_results = [make_rpc_call(chain, method, params) for method, params in chunk]
+        results.extend(chunk_results)
+    
+    return results
+
+def _post_rpc_batch(url, user, password, calls):
+    """Send one JSON-RPC batch request
+    
+    Returns:
+        list: Results in the same order as calls (None for calls with an RPC error),
+              or None if the batch request itself failed
+    """
+    # Prepare request - the list index doubles as the request id
+    headers = {"content-type": "application/json"}
+    payload = [
+        {
+            "method": method,
+            "params": params if params is not None else [],
+            "jsonrpc": "2.0",
+            "id": call_id,
+        }
+        for call_id, (method, params) in enumerate(calls)
+    ]
+    
+    try:
+        # Make request with basic auth; the daemon answers batched calls one after another
+        response = _get_rpc_session().post(
+            url,
+            auth=(user, password),
+            headers=headers,
+            json=payload,
+            timeout=RPC_TIMEOUT * len(calls),
+        )
+        
+        # Check for HTTP errors
+        if response.status_code != 200:
+            print(f"Error: HTTP status {response.status_code}, {response.text}")
+            return None
+        
+        items = response.json()
+        if not isinstance(items, list):
+            print(f"Error: unexpected RPC batch response: {items}")
+            return None
+        
+        # Responses may come back in any order - match them up by id
+        results = [None] * len(calls)
+        for item in items:
+            call_id = item.get("id")
+            if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+                continue
+            if item.get("error") is not None:
+                print(f"RPC Error ({calls[call_id][0]}): {item['error']}")
+                continue
+            results[call_id] = item.get("result")
+        
+        return results
+        
+    except Exception as e:
+        print(f"Exception making RPC batch call: {str(e)}")
+        return None
+
 def get_latest_block():
     """Get the latest block height for the chain"""
     try:
@@ -131,16 +240,10 @@ def get_currency_name(currency_id):
         currency_info = make_rpc_call("VRSC", "getcurrency", [currency_id])
         
         if currency_info and "fullyqualifiedname" in currency_info:
-            name = currency_info["fullyqualifiedname"]
-            # Try to normalize the RPC-returned name
-            normalized = normalize_currency_name(name)
-            return normalized
+            return currency_info["fullyqualifiedname"]
             
         elif currency_info and "name" in currency_info:
-            name = currency_info["name"]
-            # Try to normalize the RPC-returned name
-            normalized = normalize_currency_name(name)
-            return normalized
+            return currency_info["name"]
             
         else:
             # If all else fails, return the original ID
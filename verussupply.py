@@ -8,10 +8,9 @@ import json
 import os
 from datetime import datetime
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
 import logging
 import time
+import asyncio
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -35,8 +34,7 @@ def get_vrsc_reserves_from_converters():
     converter_details = []
     
     try:
-        # Use relative path that works on any server
-        converter_discovery_file = os.path.join(os.path.dirname(__file__), 'converter_discovery.json')
+        from converter_discovery import CONVERTER_DISCOVERY_FILE as converter_discovery_file
         
         if not os.path.exists(converter_discovery_file):
             logger.warning(f"Converter discovery file not found: {converter_discovery_file}")
@@ -71,17 +69,6 @@ def get_vrsc_reserves_from_converters():
         logger.error(f"Error reading converter discovery file: {e}")
         return total_vrsc_reserves, converter_details
 
-# Custom JSON response for pretty formatting
-class PrettyJSONResponse(JSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            jsonable_encoder(content),
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=2,
-            separators=(',', ': ')
-        ).encode('utf-8')
-
 def _is_supply_response_cache_valid():
     """Check if the cached supply response is still valid"""
     current_time = time.time()
@@ -105,6 +92,11 @@ async def get_vrsc_supply():
         logger.info(f" Serving cached VRSC supply data (age: {cache_age:.1f}s)")
         return _supply_response_cache['response']
     
+    # The supply lookup makes blocking HTTP and RPC calls; keep them off the event loop
+    return await asyncio.to_thread(_generate_vrsc_supply)
+
+def _generate_vrsc_supply():
+    """Build and cache a fresh VRSC supply response (blocking)"""
     logger.info(" Cache expired, generating fresh VRSC supply data...")
     
     try:
@@ -296,12 +288,11 @@ async def get_vrsc_supply():
             "data_source": data_source
         }
         
-        response = PrettyJSONResponse(content=response_data)
-        
-        # Cache the complete response for future requests
-        _update_supply_response_cache(response)
+        # Cache the complete response data for future requests; it is encoded per request
+        # so ?pretty=1 applies to cached responses too
+        _update_supply_response_cache(response_data)
         
-        return response
+        return response_data
         
     except Exception as e:
         logger.error(f"Error in verussupply endpoint: {str(e)}")